@@ -1279,8 +1279,8 @@ class ArangoGraphDB(GraphDB):
     async def to_query(
         self, query_model: QueryModel, *, with_edges: bool = False, consistent: Optional[bool] = None
     ) -> Tuple[str, Json]:
-        return arango_query.graph_query(
-            self, query_model, with_edges, consistent=consistent or not self.config.use_view
+        return await run_async(
+            arango_query.graph_query, self, query_model, with_edges, consistent=consistent or not self.config.use_view
         )
 
     async def insert_genesis_data(self) -> None:
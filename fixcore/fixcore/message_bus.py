@@ -5,7 +5,7 @@ from abc import ABC
 from asyncio import Queue
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Optional, Dict, List, AsyncGenerator
+from typing import Any, Optional, Dict, List, AsyncGenerator, Callable
 
 from frozendict import frozendict
 from jsons import set_deserializer, set_serializer
@@ -65,38 +65,10 @@ class Message(ABC):
         kind = json["kind"]
         message_type = json["message_type"]
         data: Json = json.get("data", {})
-        if kind == "event":
-            res_data = pop_keys(data, ["subscriber_id"])
-            return Event(message_type, res_data)
-        elif kind == "action":
-            res_data = pop_keys(data, ["task", "step", "subscriber_id"])
-            return Action(message_type, data["task"], data["step"], res_data)
-        elif kind == "action_abort":
-            res_data = pop_keys(data, ["task", "step", "subscriber_id"])
-            return ActionAbort(message_type, data["task"], data["step"], res_data)
-        elif kind == "action_done":
-            res_data = pop_keys(data, ["task", "step", "subscriber_id"])
-            return ActionDone(message_type, data["task"], data["step"], data["subscriber_id"], res_data)
-        elif kind == "action_info":
-            return ActionInfo(
-                message_type, data["task"], data["step"], data["subscriber_id"], data["level"], data["message"]
-            )
-        elif kind == "action_progress":
-            return ActionProgress(
-                message_type,
-                data["task"],
-                data["step"],
-                data["subscriber_id"],
-                Progress.from_json(data["progress"]),
-                from_utc(data["at"]),
-            )
-        elif kind == "action_error":
-            res_data = pop_keys(data, ["task", "step", "subscriber_id", "error"])
-            return ActionError(
-                message_type, data["task"], data["step"], data["subscriber_id"], data.get("error", "n/a"), res_data
-            )
-        else:
+        parser = MessageParser.get(kind)
+        if parser is None:
             raise AttributeError(f"No handler to parse {kind}")
+        return parser(message_type, data)
 
     @staticmethod
     def message_to_json(o: Message, **_: object) -> Json:
@@ -240,6 +212,57 @@ class ActionError(ActionMessage):
         return f"Fatal: could not perform action {self.step_name}. Reason: {self.error}"
 
 
+def _parse_event(message_type: str, data: Json) -> Message:
+    return Event(message_type, pop_keys(data, ["subscriber_id"]))
+
+
+def _parse_action(message_type: str, data: Json) -> Message:
+    return Action(message_type, data["task"], data["step"], pop_keys(data, ["task", "step", "subscriber_id"]))
+
+
+def _parse_action_abort(message_type: str, data: Json) -> Message:
+    return ActionAbort(message_type, data["task"], data["step"], pop_keys(data, ["task", "step", "subscriber_id"]))
+
+
+def _parse_action_done(message_type: str, data: Json) -> Message:
+    res_data = pop_keys(data, ["task", "step", "subscriber_id"])
+    return ActionDone(message_type, data["task"], data["step"], data["subscriber_id"], res_data)
+
+
+def _parse_action_info(message_type: str, data: Json) -> Message:
+    return ActionInfo(message_type, data["task"], data["step"], data["subscriber_id"], data["level"], data["message"])
+
+
+def _parse_action_progress(message_type: str, data: Json) -> Message:
+    return ActionProgress(
+        message_type,
+        data["task"],
+        data["step"],
+        data["subscriber_id"],
+        Progress.from_json(data["progress"]),
+        from_utc(data["at"]),
+    )
+
+
+def _parse_action_error(message_type: str, data: Json) -> Message:
+    res_data = pop_keys(data, ["task", "step", "subscriber_id", "error"])
+    return ActionError(
+        message_type, data["task"], data["step"], data["subscriber_id"], data.get("error", "n/a"), res_data
+    )
+
+
+# Lookup table: message kind -> parser function for this kind
+MessageParser: Dict[str, Callable[[str, Json], Message]] = {
+    "event": _parse_event,
+    "action": _parse_action,
+    "action_abort": _parse_action_abort,
+    "action_done": _parse_action_done,
+    "action_info": _parse_action_info,
+    "action_progress": _parse_action_progress,
+    "action_error": _parse_action_error,
+}
+
+
 class MessageBus(Service):
     """
     This class implements a simple event bus.
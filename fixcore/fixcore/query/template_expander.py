@@ -7,6 +7,7 @@ from typing import Any, Union, Iterable, Tuple, List, Optional, cast, Dict
 from parsy import string, Parser, regex, any_char
 from ustache import default_getter, default_virtuals, render, PropertyGetter, TagsTuple, default_tags
 
+from fixcore.async_extensions import run_async
 from fixcore.error import NoSuchTemplateError
 from fixcore.query import query_parser, QueryParser
 from fixcore.query.model import Query, Expandable, Template, PathRoot
@@ -137,7 +138,8 @@ class TemplateExpanderBase(TemplateExpander):
             omit_section_expansion = True  # already done
         rendered = self.render(to_parse, env) if env else to_parse
         expanded, _ = await self.expand(rendered)
-        result = query_parser.parse_query(expanded, env)
+        # parsing is cpu bound: do not block the event loop
+        result = await run_async(query_parser.parse_query, expanded, env)
         result = result.change_variable(self.change_well_known_names)
         return result if omit_section_expansion else result.on_section(on_section)
 
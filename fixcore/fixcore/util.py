@@ -382,6 +382,40 @@ async def force_gen(gen: AsyncIterator[AnyT]) -> AsyncIterator[AnyT]:
         return gen
 
 
+async def prefetch_gen(gen: AsyncIterator[AnyT], size: int) -> AsyncGenerator[AnyT, None]:
+    """
+    Read the given generator in a separate task into a bounded queue.
+    Elements are produced, while the consumer is still busy with earlier elements (e.g. a slow client).
+    The producer is suspended, if the queue is full.
+    """
+    queue: asyncio.Queue[Tuple[Optional[AnyT], Optional[Exception], bool]] = asyncio.Queue(size)
+
+    async def produce() -> None:
+        try:
+            async for elem in gen:
+                await queue.put((elem, None, False))
+            await queue.put((None, None, True))
+        except Exception as ex:
+            await queue.put((None, ex, True))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            elem, error, done = await queue.get()
+            if error is not None:
+                raise error
+            elif done:
+                break
+            yield elem  # type: ignore
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
+        # the producer might have been suspended on a full queue: close the source to run its cleanup now
+        if (aclose := getattr(gen, "aclose", None)) is not None:
+            await aclose()
+
+
 def set_future_result(future: Future[Any], result: Any) -> None:
     if not future.done():
         if isinstance(result, Exception):
@@ -8,7 +8,7 @@ import tempfile
 import uuid
 import zipfile
 from asyncio import Future, Queue
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import timedelta, datetime, timezone
 from functools import partial
 from io import BytesIO
@@ -35,6 +35,7 @@ from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
 import aiofiles
 import aiohttp_jinja2
 import jinja2
+import orjson
 import prometheus_client
 import yaml
 from aiohttp import (
@@ -58,7 +59,6 @@ from aiostream import stream
 from attrs import evolve
 from dateutil import parser as date_parser
 from multidict import MultiDict
-from networkx.readwrite import cytoscape_data
 
 from fixcore.action_handlers.merge_deferred_edge_handler import MergeDeferredEdgesHandler
 from fixcore.analytics import AnalyticsEvent
@@ -111,6 +111,7 @@ from fixcore.util import (
     force_gen,
     if_set,
     parse_utc,
+    prefetch_gen,
     rnd_str,
     utc,
     utc_str,
@@ -118,7 +119,7 @@ from fixcore.util import (
     value_in_path_get,
 )
 from fixcore.web.auth import raw_jwt_from_auth_message, LoginWithCode, AuthHandler
-from fixcore.web.content_renderer import result_binary_gen, single_result
+from fixcore.web.content_renderer import result_binary_gen, single_result, json_bytes
 from fixcore.web.directives import (
     metrics_handler,
     error_handler,
@@ -143,12 +144,16 @@ log = logging.getLogger(__name__)
 
 
 def section_of(request: Request) -> Optional[str]:
-    section = request.match_info.get("section", request.query.get("section"))
+    section = request.match_info.get("section") or request.query.get("section")
     if section and section != "/" and section not in Section.content:
         raise AttributeError(f"Given section does not exist: {section}")
     return section
 
 
+def graph_name_of(request: Request) -> GraphName:
+    return GraphName(request.match_info.get("graph_id", "fix"))
+
+
 # No Authorization required for following paths
 AlwaysAllowed = {
     "/",
@@ -167,6 +172,20 @@ AlwaysAllowed = {
 # Authorization is not required, but implemented as part of the request handler
 DeferredCheck = {"/events", "/work/queue"}
 
+# Resolve the package directories once on import, not for every Api instance
+PackageDir = Path(__file__).resolve().parent.parent
+StaticPath = str(PackageDir / "static")
+TemplatesPath = str(PackageDir / "templates")
+JupyterlitePath = PackageDir / "jupyterlite"
+# Size of chunks read from a streamed request body
+StreamChunkSize = 64 * 1024
+# Streamed responses are written once this size is buffered or no further element arrived within this many seconds.
+# 64KiB is the default high-water mark of the asyncio transport write buffer.
+StreamBufferSize = 64 * 1024
+StreamBufferMaxDelay = 0.1
+# Number of elements that are read ahead while a streamed response is written
+StreamPrefetchSize = 64
+
 
 # noinspection PyMethodMayBeStatic
 class Api(Service):
@@ -202,9 +221,7 @@ class Api(Service):
         path_part = deps.config.api.web_path.strip().strip("/").strip()
         web_path = "" if path_part == "" else f"/{path_part}"
         self.__add_routes(web_path)
-        aiohttp_jinja2.setup(
-            self.app, loader=jinja2.FileSystemLoader(os.path.abspath(os.path.dirname(__file__) + "/../templates"))
-        )
+        aiohttp_jinja2.setup(self.app, loader=jinja2.FileSystemLoader(TemplatesPath))
 
     @property
     def session(self) -> ClientSession:
@@ -215,10 +232,8 @@ class Api(Service):
         return self._session
 
     def __add_routes(self, prefix: str) -> None:
-        static_path = os.path.abspath(os.path.dirname(__file__) + "/../static")
-        jupyterlite_path = Path(os.path.abspath(os.path.dirname(__file__) + "/../jupyterlite"))
-        if not jupyterlite_path.exists():
-            jupyterlite_path.mkdir(parents=True, exist_ok=True)
+        if not JupyterlitePath.exists():
+            JupyterlitePath.mkdir(parents=True, exist_ok=True)
         require = self.auth_handler.allow_with
         r = Permission.read
         w = Permission.write
@@ -307,9 +322,9 @@ class Api(Service):
                 web.get(prefix + "/work/list", require(self.list_work, a)),
                 # Serve static filed
                 web.get(prefix, self.home_page),
-                web.static(prefix + "/static", static_path),
+                web.static(prefix + "/static", StaticPath),
                 web.get(prefix + "/notebook", self.forward("/notebook/index.html")),
-                web.static(prefix + "/notebook", jupyterlite_path),
+                web.static(prefix + "/notebook", JupyterlitePath),
                 # metrics
                 web.get(prefix + "/metrics", self.metrics),
                 # config operations
@@ -350,7 +365,7 @@ class Api(Service):
             self.app.add_routes([web.get(prefix + "/debug/ui/{commit}/{path:.+}", self.serve_debug_ui)])
         SwaggerFile(
             self.app,
-            spec_file=f"{static_path}/api-doc.yaml",
+            spec_file=f"{StaticPath}/api-doc.yaml",
             swagger_ui_settings=SwaggerUiSettings(path=prefix + "/api-doc", layout="BaseLayout", docExpansion="none"),
         )
 
@@ -802,7 +817,8 @@ class Api(Service):
 
     async def handle_events(self, request: Request, deps: TenantDependencies) -> StreamResponse:
         show = request.query["show"].split(",") if "show" in request.query else ["*"]
-        return await self.listen_to_events(request, deps, SubscriberId(str(uuid.uuid1())), show)
+        # ephemeral listener id: random uuid4, no clock or node lookup as with uuid1
+        return await self.listen_to_events(request, deps, SubscriberId(str(uuid.uuid4())), show)
 
     async def send_analytics_events(self, request: Request, _: TenantDependencies) -> StreamResponse:
         events_json = await self.json_from_request(request)
@@ -923,7 +939,7 @@ class Api(Service):
 
     async def model_uml(self, request: Request, deps: TenantDependencies) -> StreamResponse:
         output = request.query.get("output", "svg")
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         show = request.query["show"].split(",") if "show" in request.query else None
         hide = request.query["hide"].split(",") if "hide" in request.query else None
         with_inheritance = request.query.get("with_inheritance", "true") != "false"
@@ -969,7 +985,7 @@ class Api(Service):
                 return False
             return s.split(",")
 
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         full_model = await deps.model_handler.load_model(graph_id)
         with_bases = if_set(request.query.get("with_bases"), lambda x: x.lower() == "true", False)
         with_property_kinds = if_set(request.query.get("with_property_kinds"), lambda x: x.lower() == "true", False)
@@ -1009,7 +1025,7 @@ class Api(Service):
             return await single_result(request, json.loads(json.dumps(json_model, sort_keys=True)))
 
     async def update_model(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         js = await self.json_from_request(request)
         replace = request.method == "PUT"
         kinds: List[Kind] = from_js(js, List[Kind])
@@ -1017,7 +1033,7 @@ class Api(Service):
         return await single_result(request, to_js(model, strip_nulls=True))
 
     async def get_node(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         node_id = NodeId(request.match_info.get("node_id", "root"))
         graph = deps.db_access.get_graph_db(graph_id)
         model = await deps.model_handler.load_model(graph_id)
@@ -1028,7 +1044,7 @@ class Api(Service):
             return await single_result(request, node)
 
     async def create_node(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         node_id = NodeId(request.match_info.get("node_id", "some_existing"))
         parent_node_id = NodeId(request.match_info.get("parent_node_id", "root"))
         graph = deps.db_access.get_graph_db(graph_id)
@@ -1038,7 +1054,7 @@ class Api(Service):
         return await single_result(request, node)
 
     async def update_node(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         node_id = NodeId(request.match_info.get("node_id", "some_existing"))
         section = section_of(request)
         graph = deps.db_access.get_graph_db(graph_id)
@@ -1059,7 +1075,7 @@ class Api(Service):
         return await single_result(request, node)
 
     async def delete_node(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_name = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_name = graph_name_of(request)
         node_id = NodeId(request.match_info.get("node_id", "some_existing"))
         keep_history = request.query.get("keep_history", "false").lower() == "true"
         if node_id == "root":
@@ -1070,7 +1086,7 @@ class Api(Service):
         return web.HTTPNoContent()
 
     async def update_nodes(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_name = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_name = graph_name_of(request)
         allowed = {*Section.content, "id", "revision"}
         updates: Dict[NodeId, Json] = {}
         async for elem in self.to_json_generator(request):
@@ -1092,7 +1108,7 @@ class Api(Service):
         return await single_result(request, graphs)
 
     async def create_graph(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_name = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_name = graph_name_of(request)
         if valid_root_graph_name(graph_name) is False:
             raise AttributeError("Graph name is not valid (no underscores, can not start with snapshot-)")
         graph = await deps.db_access.create_graph(graph_name)
@@ -1108,7 +1124,7 @@ class Api(Service):
         return await single_result(request, {"processed": r.processed, "updated": r.updated, "deleted": r.deleted})
 
     async def merge_graph(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         wait_for_result = request.query.get("wait_for_result", "true").lower() == "true"
         task_id: Optional[TaskId] = None
         if tid := request.headers.get("Fix-Worker-Task-Id"):
@@ -1123,7 +1139,7 @@ class Api(Service):
         return web.json_response(to_js(info)) if info else web.HTTPNoContent()
 
     async def update_merge_graph_batch(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         wait_for_result = request.query.get("wait_for_result", "true").lower() == "true"
         task_id: Optional[TaskId] = None
         if tid := request.headers.get("Fix-Worker-Task-Id"):
@@ -1139,25 +1155,25 @@ class Api(Service):
         return web.json_response(to_json(info), headers=headers) if info else web.HTTPNoContent(headers=headers)
 
     async def list_batches(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_db = deps.db_access.get_graph_db(GraphName(request.match_info.get("graph_id", "fix")))
+        graph_db = deps.db_access.get_graph_db(graph_name_of(request))
         batch_updates = await graph_db.list_in_progress_updates()
         return web.json_response([b for b in batch_updates if b.get("is_batch")])
 
     async def commit_batch(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_db = deps.db_access.get_graph_db(GraphName(request.match_info.get("graph_id", "fix")))
+        graph_db = deps.db_access.get_graph_db(graph_name_of(request))
         batch_id = request.match_info.get("batch_id", "some_existing")
         update_history = request.query.get("update_history", "true").lower() == "true"
         await graph_db.commit_batch_update(batch_id, update_history)
         return web.HTTPOk(body="Batch committed.")
 
     async def abort_batch(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_db = deps.db_access.get_graph_db(GraphName(request.match_info.get("graph_id", "fix")))
+        graph_db = deps.db_access.get_graph_db(graph_name_of(request))
         batch_id = request.match_info.get("batch_id", "some_existing")
         await graph_db.abort_update(batch_id)
         return web.HTTPOk(body="Batch aborted.")
 
     async def graph_model_from_request(self, request: Request, deps: TenantDependencies) -> Tuple[GraphName, Model]:
-        graph_name = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_name = graph_name_of(request)
         raw_at = request.query.get("at")
         at = date_parser.parse(raw_at) if raw_at else None
         snapshot_name = None
@@ -1240,12 +1256,6 @@ class Api(Service):
                 request, cursor, count=cursor.count(), total_count=cursor.full_count(), query_stats=cursor.stats()
             )
 
-    async def cytoscape(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_db, query_model = await self.graph_query_model_from_request(request, deps)
-        result = await graph_db.search_graph(query_model)
-        node_link_data = cytoscape_data(result)
-        return web.json_response(node_link_data)
-
     async def query_graph_stream(self, request: Request, deps: TenantDependencies) -> StreamResponse:
         graph_db, query_model = await self.graph_query_model_from_request(request, deps)
         count = request.query.get("count", "true").lower() != "false"
@@ -1316,7 +1326,7 @@ class Api(Service):
         return FileResponse(file)
 
     async def wipe(self, request: Request, deps: TenantDependencies) -> StreamResponse:
-        graph_id = GraphName(request.match_info.get("graph_id", "fix"))
+        graph_id = graph_name_of(request)
         if "truncate" in request.query:
             await deps.db_access.get_graph_db(graph_id).wipe()
             return web.HTTPOk(body="Graph truncated.")
@@ -1515,13 +1525,30 @@ class Api(Service):
     @staticmethod
     def to_line_generator(request: Request) -> AsyncGenerator[Union[bytes, Json], None]:
         async def stream_lines() -> AsyncGenerator[Union[bytes, Json], None]:
-            async for line in request.content:
-                if len(line.strip()) == 0:
+            # read the body in larger chunks and split locally: fewer awaits than reading line by line
+            # incomplete last line: carried over to the next chunk in a mutable buffer
+            rest = bytearray()
+            async for chunk in request.content.iter_chunked(StreamChunkSize):
+                # only the new chunk needs to be searched: rest does not contain a newline
+                end = chunk.rfind(b"\n")
+                if end >= 0:
+                    end += len(rest)
+                rest += chunk
+                if end < 0:
                     continue
-                yield line
+                complete = bytes(rest[:end])
+                del rest[: end + 1]
+                for line in complete.split(b"\n"):
+                    if len(line.strip()) == 0:
+                        continue
+                    yield line + b"\n"
+            if len(rest.strip()) > 0:
+                yield bytes(rest)
 
         async def stream_json_array() -> AsyncGenerator[Union[bytes, Json], None]:
-            js_elem = await request.json()
+            # parse the raw bytes directly: avoids decoding the body to str first.
+            # json is used instead of orjson, which does not support int > 64 bit.
+            js_elem = json.loads(await request.read())
             if isinstance(js_elem, list):
                 for doc in js_elem:
                     yield doc
@@ -1540,7 +1567,8 @@ class Api(Service):
     @staticmethod
     def optional_json(o: Any, hint: str) -> StreamResponse:
         if o:
-            return web.json_response(to_json(o))
+            # encode with orjson directly to bytes: no intermediate str
+            return web.Response(body=json_bytes(to_json(o)), content_type="application/json")
         else:
             return web.HTTPNotFound(text=hint)
 
@@ -1554,8 +1582,9 @@ class Api(Service):
         query_stats: Optional[Json] = None,
         additional_header: Optional[Dict[str, str]] = None,
     ) -> StreamResponse:
-        # force the async generator, to get an early exception in case of failure
-        gen = await force_gen(gen_in)
+        # force the async generator, to get an early exception in case of failure.
+        # elements are prefetched, so reading the next elements overlaps with writing the response.
+        gen = prefetch_gen(await force_gen(gen_in), StreamPrefetchSize)
         content_type, result_gen = await result_binary_gen(request, gen)
         headers = {"Content-Type": content_type}
         if additional_header:
@@ -1569,9 +1598,46 @@ class Api(Service):
         response = web.StreamResponse(status=200, headers=headers)
         enable_compression(request, response)
         writer: AbstractStreamWriter = await response.prepare(request)  # type: ignore
-        cr = "\n".encode("utf-8")
-        async for data in result_gen:
-            await writer.write(data + cr)
+        cr = b"\n"
+        # collect elements and write them in larger chunks: a write per element is expensive.
+        # a single flusher task writes buffered elements, if no further element arrives within the max delay.
+        buffer = bytearray()
+        has_data = asyncio.Event()
+        write_lock = asyncio.Lock()
+
+        async def write_buffer() -> None:
+            # take the content without await in between, so elements added during the write stay in the buffer
+            chunk = bytes(buffer)  # copy: the transport might hold a reference
+            buffer.clear()
+            await writer.write(chunk)
+
+        async def flush_delayed() -> None:
+            while True:
+                await has_data.wait()
+                await asyncio.sleep(StreamBufferMaxDelay)
+                async with write_lock:
+                    has_data.clear()
+                    if buffer:
+                        await write_buffer()
+
+        flusher = asyncio.create_task(flush_delayed())
+        try:
+            async for data in result_gen:
+                buffer += data
+                buffer += cr
+                if len(buffer) >= StreamBufferSize:
+                    async with write_lock:
+                        await write_buffer()
+                else:
+                    has_data.set()
+        finally:
+            # the flusher is not cancelled while it writes
+            async with write_lock:
+                flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await flusher
+        if buffer:
+            await write_buffer()
         await response.write_eof()
         return response
 
@@ -4,51 +4,102 @@ import re
 from collections import defaultdict
 from typing import AsyncGenerator, List, Dict, AsyncIterator, Tuple, Callable, Optional, Any
 
+import orjson
 import yaml
-from aiohttp.web import StreamResponse, Request, Response, json_response
+from aiohttp.web import StreamResponse, Request, Response
 from networkx import DiGraph, cytoscape_data, generate_graphml
 
 from fixcore.cli import is_node
 from fixcore.constants import plain_text_blacklist
+from fixcore.async_extensions import run_async
 from fixcore.error import QueryTookToLongError
 from fixcore.model.resolve_in_graph import NodePath
 from fixcore.model.typed_model import to_json
 from fixcore.types import Json, JsonElement
-from fixcore.util import del_value_in_path, value_in_path, value_in_path_get, count_iterator, identity
+from fixcore.util import value_in_path, value_in_path_get, count_iterator, identity
+
+try:
+    # the libyaml emitter is considerably faster than the pure python one
+    from yaml import CDumper as Dumper
+except ImportError:
+    from yaml import Dumper  # type: ignore
 
 log = logging.getLogger(__name__)
 
+# Static delimiters of the binary renderers: encoded once
+JsonArrayOpen = b"["
+JsonArrayClose = b"]"
+JsonArraySeparator = b",\n"
+YamlDocumentSeparator = b"---\n"
 
-async def respond_json(gen: AsyncIterator[JsonElement], **json_args: Any) -> AsyncGenerator[str, None]:
-    sep = ","
-    yield "["
+
+def json_bytes(js: JsonElement) -> bytes:
+    try:
+        return orjson.dumps(js)
+    except TypeError:
+        # orjson does not support everything the json module does (e.g. int > 64 bit, non string keys)
+        return json.dumps(js, check_circular=False).encode("utf-8")
+
+
+async def respond_json_bytes(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[bytes, None]:
+    # the separator is emitted together with the element: one chunk per element
+    yield JsonArrayOpen
     first = True
     async for item in gen:
-        js = json.dumps(to_json(item), **json_args)
-        if not first:
-            yield sep
-        yield js
+        js = json_bytes(to_json(item))
+        yield js if first else JsonArraySeparator + js
         first = False
-    yield "]"
+    yield JsonArrayClose
 
 
-async def respond_ndjson(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, None]:
+async def respond_ndjson_bytes(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[bytes, None]:
     async for item in gen:
-        js = json.dumps(to_json(item), check_circular=False)
-        yield js
+        yield json_bytes(to_json(item))
+
+
+async def respond_json(gen: AsyncIterator[JsonElement], **json_args: Any) -> AsyncGenerator[str, None]:
+    if json_args:
+        # orjson can not handle json_args (e.g. indent): use the json module in this case
+        sep = ",\n"
+        yield "["
+        first = True
+        async for item in gen:
+            js = json.dumps(to_json(item), **json_args)
+            yield js if first else sep + js
+            first = False
+        yield "]"
+    else:
+        async for elem in respond_json_bytes(gen):
+            yield elem.decode("utf-8")
+
+
+async def respond_ndjson(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, None]:
+    async for elem in respond_ndjson_bytes(gen):
+        yield elem.decode("utf-8")
 
 
 async def respond_yaml(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, None]:
     flag = False
-    sep = "---"
+    sep = "---\n"
     async for item in gen:
-        yml = yaml.dump(to_json(item), default_flow_style=False, sort_keys=False)
-        if flag:
-            yield sep
-        yield yml
+        yml = yaml.dump(to_json(item), Dumper=Dumper, default_flow_style=False, sort_keys=False)
+        yield sep + yml if flag else yml
         flag = True
 
 
+async def respond_yaml_bytes(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[bytes, None]:
+    flag = False
+    async for item in gen:
+        # the emitter encodes directly, when an encoding is given
+        yml = yaml.dump(to_json(item), Dumper=Dumper, encoding="utf-8", default_flow_style=False, sort_keys=False)
+        yield YamlDocumentSeparator + yml if flag else yml
+        flag = True
+
+
+# Characters that are replaced in dot node labels
+DotInvalidChars = re.compile("[^a-zA-Z\\-0-9]")
+
+
 async def respond_dot(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, None]:
     # We use the paired12 color scheme: https://graphviz.org/doc/info/colors.html with color names as 1-12
     cit = count_iterator()
@@ -63,7 +114,7 @@ async def respond_dot(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, No
             if type_name == "node":
                 uid = value_in_path(item, NodePath.node_id)
                 if uid:
-                    name = re.sub("[^a-zA-Z\\-0-9]", "_", value_in_path_get(item, NodePath.reported_name, "n/a"))
+                    name = DotInvalidChars.sub("_", value_in_path_get(item, NodePath.reported_name, "n/a"))
                     kind = value_in_path_get(item, NodePath.reported_kind, "n/a")
                     account = value_in_path_get(item, NodePath.ancestor_account_name, "graph_root")
                     paired12 = colors[kind]
@@ -87,12 +138,41 @@ async def respond_dot(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, No
     yield "}"
 
 
+def path_trie(paths: List[List[str]]) -> Dict[str, Any]:
+    """
+    Create a trie from the given paths. Leaves are marked with None.
+    Example: [["a"], ["b", "c"], ["b", "d"]] -> {"a": None, "b": {"c": None, "d": None}}
+    """
+    trie: Dict[str, Any] = {}
+    for path in paths:
+        current = trie
+        for part in path[:-1]:
+            current = current.setdefault(part, {})
+        current[path[-1]] = None
+    return trie
+
+
+def del_paths_in_trie(js: Json, trie: Dict[str, Any]) -> None:
+    # same semantics as del_value_in_path for every path in the trie, but shared prefixes are walked only once
+    for key, sub in trie.items():
+        if key in js:
+            if sub is None:
+                js.pop(key, None)
+            else:
+                if isinstance(value := js[key], dict):
+                    del_paths_in_trie(value, sub)
+                if not js[key]:
+                    js[key] = None
+
+
+# The blacklist is walked for every node: shared prefixes (e.g. metadata) are only looked up once.
+PlainTextBlacklistTrie = path_trie(plain_text_blacklist)
+
+
 async def respond_text(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, None]:
     def filter_attrs(js: Json) -> Json:
-        result: Json = js
-        for path in plain_text_blacklist:
-            del_value_in_path(js, path)
-        return result
+        del_paths_in_trie(js, PlainTextBlacklistTrie)
+        return js
 
     def to_result(js: JsonElement) -> JsonElement:
         # if js is a node, the resulting content should be filtered
@@ -100,14 +180,14 @@ async def respond_text(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str, N
 
     try:
         flag = False
-        sep = "---"
+        sep = "---\n"
         async for item in gen:
             js = to_json(item)
             if isinstance(js, (dict, list)):
-                if flag:
-                    yield sep
-                yml = yaml.dump(to_result(js), allow_unicode=True, default_flow_style=False, sort_keys=False)
-                yield yml
+                yml = yaml.dump(
+                    to_result(js), Dumper=Dumper, allow_unicode=True, default_flow_style=False, sort_keys=False
+                )
+                yield sep + yml if flag else yml
             else:
                 yield str(js)
             flag = True
@@ -166,28 +246,80 @@ async def respond_graphml(gen: AsyncIterator[JsonElement]) -> AsyncGenerator[str
         yield line
 
 
-async def result_string_gen(request: Request, gen: AsyncIterator[JsonElement]) -> Tuple[str, AsyncIterator[str]]:
+# accept header -> (content type, renderer)
+StringRenderers: Dict[str, Tuple[str, Callable[[AsyncIterator[JsonElement]], AsyncIterator[str]]]] = {
+    "application/x-ndjson": ("application/x-ndjson", respond_ndjson),
+    "application/ndjson": ("application/x-ndjson", respond_ndjson),
+    "application/json": ("application/json", respond_json),
+    "text/plain": ("text/plain", respond_text),
+    "application/yaml": ("text/yaml", respond_yaml),
+    "text/yaml": ("text/yaml", respond_yaml),
+    "application/vnd.cytoscape+json": ("application/vnd.cytoscape+json", respond_cytoscape),
+    "application/graphml+xml": ("application/graphml+xml", respond_graphml),
+    "application/vnd.graphml+xml": ("application/graphml+xml", respond_graphml),
+    "text/vnd.graphviz": ("text/yaml", respond_dot),
+}
+# accept header -> (content type, renderer): formats that are encoded to bytes directly
+BinaryRenderers: Dict[str, Tuple[str, Callable[[AsyncIterator[JsonElement]], AsyncIterator[bytes]]]] = {
+    "application/x-ndjson": ("application/x-ndjson", respond_ndjson_bytes),
+    "application/ndjson": ("application/x-ndjson", respond_ndjson_bytes),
+    "application/json": ("application/json", respond_json_bytes),
+    "application/yaml": ("text/yaml", respond_yaml_bytes),
+    "text/yaml": ("text/yaml", respond_yaml_bytes),
+}
+
+
+def accepted_media_types(accept: str) -> List[str]:
+    """
+    Parse an accept header into the list of media types, ordered by the quality value (highest first).
+    Media types with quality 0 are not acceptable and left out.
+    Example: "text/plain;q=0.5, application/json" -> ["application/json", "text/plain"]
+    """
+    weighted: List[Tuple[float, str]] = []
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    pass
+        if quality > 0:
+            weighted.append((quality, media_type.strip()))
+    # sort is stable: media types with the same quality keep their order
+    weighted.sort(key=lambda x: x[0], reverse=True)
+    return [media_type for _, media_type in weighted]
+
+
+def renderer_key(request: Request) -> str:
     accept = request.headers.get("accept", "application/json")
-    if accept in ["application/x-ndjson", "application/ndjson"]:
-        return "application/x-ndjson", respond_ndjson(gen)
-    elif accept == "application/json":
-        return "application/json", respond_json(gen)
-    elif accept in ["text/plain"]:
-        return "text/plain", respond_text(gen)
-    elif accept in ["application/yaml", "text/yaml"]:
-        return "text/yaml", respond_yaml(gen)
-    elif accept == "application/vnd.cytoscape+json":
-        return "application/vnd.cytoscape+json", respond_cytoscape(gen)
-    elif accept in ["application/graphml+xml", "application/vnd.graphml+xml"]:
-        return "application/graphml+xml", respond_graphml(gen)
-    elif accept.startswith("text/vnd.graphviz"):
-        return "text/yaml", respond_dot(gen)
-    else:
-        return "application/json", respond_json(gen)
+    # fast path: a single media type without parameters
+    if accept in StringRenderers:
+        return accept
+    for media_type in accepted_media_types(accept):
+        if media_type in StringRenderers:
+            return media_type
+        elif media_type.startswith("text/vnd.graphviz"):
+            return "text/vnd.graphviz"
+    return "application/json"
+
+
+async def result_string_gen(request: Request, gen: AsyncIterator[JsonElement]) -> Tuple[str, AsyncIterator[str]]:
+    content_type, renderer = StringRenderers[renderer_key(request)]
+    return content_type, renderer(gen)
 
 
 async def result_binary_gen(request: Request, gen: AsyncIterator[JsonElement]) -> Tuple[str, AsyncIterator[bytes]]:
-    content_type, str_gen = await result_string_gen(request, gen)
+    key = renderer_key(request)
+    # json and yaml are encoded to bytes directly: no need to go through str
+    if binary := BinaryRenderers.get(key):
+        content_type, binary_renderer = binary
+        return content_type, binary_renderer(gen)
+
+    content_type, renderer = StringRenderers[key]
+    str_gen = renderer(gen)
 
     async def encode_utf8() -> AsyncIterator[bytes]:
         async for elem in str_gen:
@@ -196,13 +328,48 @@ async def result_binary_gen(request: Request, gen: AsyncIterator[JsonElement]) -
     return content_type, encode_utf8()
 
 
+# Results with more nested values or more string characters are encoded in a separate thread.
+# Below these limits encoding is faster than handing the result over to a thread.
+SingleResultInlineValues = 1000
+SingleResultInlineChars = 64 * 1024
+
+
+def is_large_result(js: JsonElement) -> bool:
+    """
+    Estimate the size of a json element by counting its nested values and string characters.
+    The walk stops as soon as a limit is exceeded, so the estimate itself is cheap for large results.
+    """
+    values = 0
+    chars = 0
+    todo: List[JsonElement] = [js]
+    while todo:
+        elem = todo.pop()
+        if isinstance(elem, dict):
+            values += len(elem)
+            if values > SingleResultInlineValues:
+                return True
+            todo.extend(elem.values())
+        elif isinstance(elem, list):
+            values += len(elem)
+            if values > SingleResultInlineValues:
+                return True
+            todo.extend(elem)
+        elif isinstance(elem, str):
+            chars += len(elem)
+            if chars > SingleResultInlineChars:
+                return True
+    return False
+
+
 async def single_result(
     request: Request, js: JsonElement, headers: Optional[Dict[str, Optional[str]]] = None
 ) -> StreamResponse:
     non_empty = {k: v for k, v in headers.items() if isinstance(v, str)} if headers else None
-    accept = request.headers.get("accept", "application/json")
-    if accept in ["application/yaml", "text/yaml"]:
-        yml = yaml.dump(js)
+    # encoding a large result (e.g. the model) takes a while: do not block the event loop in this case
+    large = is_large_result(js)
+    if renderer_key(request) in ("application/yaml", "text/yaml"):
+        yml = await run_async(yaml.dump, js, Dumper=Dumper) if large else yaml.dump(js, Dumper=Dumper)
         return Response(text=yml, content_type="application/yaml", headers=non_empty)
     else:
-        return json_response(js, headers=non_empty)
+        body = await run_async(json_bytes, js) if large else json_bytes(js)
+        return Response(body=body, content_type="application/json", headers=non_empty)
@@ -70,19 +70,22 @@ async def cors_handler(request: Request, handler: RequestHandler) -> StreamRespo
 @middleware
 async def metrics_handler(request: Request, handler: RequestHandler) -> StreamResponse:
     request["start_time"] = perf_now()
-    RequestInProgress.labels(request.path, request.method).inc()
+    path, method = request.path, request.method
+    # resolve the labelled child once: used for inc and dec
+    in_progress = RequestInProgress.labels(path, method)
+    in_progress.inc()
     try:
         response = await handler(request)
-        RequestCount.labels(request.method, request.path, response.status).inc()
+        RequestCount.labels(method, path, response.status).inc()
         return response
     except HTTPException as ex:
-        RequestCount.labels(request.method, request.path, ex.status).inc()
+        RequestCount.labels(method, path, ex.status).inc()
         raise ex
     finally:
         resp_time = perf_now() - request["start_time"]
-        log.debug(f"Request {request} took {resp_time} s")
-        RequestLatency.labels(request.path).observe(resp_time)
-        RequestInProgress.labels(request.path, request.method).dec()
+        log.debug("Request %s took %s s", request, resp_time)
+        RequestLatency.labels(path).observe(resp_time)
+        in_progress.dec()
 
 
 def error_handler(config: CoreConfig, event_sender: AnalyticsEventSender) -> Middleware:
@@ -104,22 +107,22 @@ def error_handler(config: CoreConfig, event_sender: AnalyticsEventSender) -> Mid
             # redirects are implemented as exceptions in aiohttp for whatever reason...
             raise e
         except HTTPError as e:
-            log.warning(f"Request {request} has failed with exception: {str(e)}")
+            log.warning("Request %s has failed with exception: %s", request, e)
             raise e
         except NotFoundError as e:
             message, _, _ = message_from_error(e)
-            log.info(f"Request {request} has failed with exception: {message}", exc_info=exc_info(e))
+            log.info("Request %s has failed with exception: %s", request, message, exc_info=exc_info(e))
             raise HTTPNotFound(text=message) from e
         except (ClientError, AttributeError) as e:
             message, kind, ex_str = message_from_error(e)
-            log.info(f"Request {request} has failed with exception: {message}", exc_info=exc_info(e))
+            log.info("Request %s has failed with exception: %s", request, message, exc_info=exc_info(e))
             await event_sender.core_event(
                 CoreEvent.ClientError, {"version": version(), "kind": kind, "message": ex_str}
             )
             raise HTTPBadRequest(text=message) from e
         except Exception as e:
             message, kind, ex_str = message_from_error(e)
-            log.warning(f"Request {request} has failed with exception: {message}", exc_info=exc_info(e))
+            log.warning("Request %s has failed with exception: %s", request, message, exc_info=exc_info(e))
             await event_sender.core_event(
                 CoreEvent.ServerError, {"version": version(), "kind": kind, "message": ex_str}
             )
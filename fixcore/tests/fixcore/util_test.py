@@ -2,6 +2,7 @@ import json
 import shutil
 from copy import deepcopy
 from datetime import datetime, timezone
+from typing import AsyncIterator
 
 import pytest
 import pytz
@@ -10,6 +11,7 @@ from aiostream import stream
 from fixcore.util import (
     AccessJson,
     force_gen,
+    prefetch_gen,
     uuid_str,
     value_in_path,
     value_in_path_get,
@@ -120,6 +122,37 @@ async def test_async_gen() -> None:
         assert [x async for x in await force_gen(elems)] == list(range(0, 100))
 
 
+@pytest.mark.asyncio
+async def test_prefetch_gen() -> None:
+    async with stream.iterate(range(0, 100)).stream() as elems:
+        assert [x async for x in prefetch_gen(elems, 10)] == list(range(0, 100))
+
+    async with stream.empty().stream() as empty:
+        assert [x async for x in prefetch_gen(empty, 10)] == []
+
+    with pytest.raises(Exception, match="boom"):
+        async with stream.throw(Exception("boom")).stream() as err:
+            async for _ in prefetch_gen(err, 10):
+                pass
+
+    # the source is closed, when the consumer stops early
+    closed = False
+
+    async def source() -> AsyncIterator[int]:
+        nonlocal closed
+        try:
+            for i in range(0, 100):
+                yield i
+        finally:
+            closed = True
+
+    prefetched = prefetch_gen(source(), 2)
+    async for _ in prefetched:
+        break
+    await prefetched.aclose()
+    assert closed
+
+
 def test_deep_merge() -> None:
     l = {"a": {"b": 1, "d": 2}, "d": 2, "e": 4}
     r = {"a": {"c": 1, "d": 3}, "d": 1}
@@ -1,7 +1,7 @@
 from asyncio import sleep
 from contextlib import suppress, asynccontextmanager
 from multiprocessing import Process
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, List, Optional, Any
 from pathlib import Path
 import tempfile
 
@@ -26,6 +26,7 @@ from fixcore.model.model import predefined_kinds, Kind
 from fixcore.model.typed_model import to_js
 from fixcore.util import rnd_str, AccessJson, utc, utc_str
 from fixcore.ids import GraphName
+from fixcore.web.api import Api
 
 
 def graph_to_json(graph: MultiDiGraph) -> List[rc.JsObject]:
@@ -619,3 +620,30 @@ async def test_authorization(core_client_with_psk: FixInventoryClient, client_se
     async with client_session.get(f"{url}/authorization/renew", headers={"Authorization": auth_header}) as resp:
         assert resp.status == 200
         assert resp.headers["Authorization"].startswith("Bearer ")
+
+
+class ChunkedContent:
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.data = data
+        self.chunk_size = chunk_size
+
+    async def iter_chunked(self, _: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.data), self.chunk_size):
+            yield self.data[start : start + self.chunk_size]
+
+
+class ChunkedRequest:
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.content_type = "application/x-ndjson"
+        self.content = ChunkedContent(data, chunk_size)
+
+
+@pytest.mark.asyncio
+async def test_line_generator() -> None:
+    async def lines(data: bytes, chunk_size: int) -> List[Any]:
+        return [line async for line in Api.to_line_generator(ChunkedRequest(data, chunk_size))]  # type: ignore
+
+    assert await lines(b'{"a": 1}\n\n{"b": 2}\nlast', 3) == [b'{"a": 1}\n', b'{"b": 2}\n', b"last"]
+    # one long line that arrives in many chunks
+    long_line = b"x" * 1_000_000
+    assert await lines(long_line + b"\n" + long_line, 1024) == [long_line + b"\n", long_line]
@@ -17,6 +17,14 @@ from fixcore.web.content_renderer import (
     respond_text,
     respond_cytoscape,
     respond_graphml,
+    json_bytes,
+    respond_json_bytes,
+    respond_ndjson_bytes,
+    respond_yaml_bytes,
+    accepted_media_types,
+    path_trie,
+    del_paths_in_trie,
+    is_large_result,
 )
 from tests.fixcore.hypothesis_extension import (
     json_array_gen,
@@ -37,6 +45,26 @@ async def test_json(elements: List[JsonElement]) -> None:
         assert json.loads(result) == elements
 
 
+@given(json_array_gen)
+@settings(max_examples=20, suppress_health_check=list(HealthCheck), deadline=1000)
+@pytest.mark.asyncio
+async def test_json_and_ndjson_as_bytes(elements: List[JsonElement]) -> None:
+    async with stream.iterate(elements).stream() as streamer:
+        result = b""
+        async for elem in respond_json_bytes(streamer):
+            result += elem
+        assert json.loads(result) == elements
+    async with stream.iterate(elements).stream() as streamer:
+        assert [json.loads(elem) async for elem in respond_ndjson_bytes(streamer)] == elements
+
+
+def test_json_bytes() -> None:
+    assert json.loads(json_bytes({"a": [1, "b", None, True]})) == {"a": [1, "b", None, True]}
+    # not supported by orjson: falls back to the json module
+    assert json.loads(json_bytes({"a": 2**70})) == {"a": 2**70}
+    assert json.loads(json_bytes({1: "a"})) == {"1": "a"}
+
+
 @given(json_array_gen)
 @settings(max_examples=20, suppress_health_check=list(HealthCheck), deadline=1000)
 @pytest.mark.asyncio
@@ -59,6 +87,17 @@ async def test_yaml(elements: List[JsonElement]) -> None:
         assert [a for a in yaml.full_load_all(result)] == elements
 
 
+@given(json_array_gen)
+@settings(max_examples=20, suppress_health_check=list(HealthCheck), deadline=1000)
+@pytest.mark.asyncio
+async def test_yaml_as_bytes(elements: List[JsonElement]) -> None:
+    async with stream.iterate(elements).stream() as streamer:
+        result = b""
+        async for elem in respond_yaml_bytes(streamer):
+            result += elem + b"\n"
+        assert [a for a in yaml.full_load_all(result)] == elements
+
+
 @given(lists(json_simple_element_gen, min_size=1, max_size=10))
 @settings(max_examples=20, suppress_health_check=list(HealthCheck), deadline=1000)
 @pytest.mark.asyncio
@@ -146,3 +185,33 @@ async def test_dot() -> None:
             "}\n"
         )
         assert result == expected
+
+
+def test_accepted_media_types() -> None:
+    assert accepted_media_types("application/json") == ["application/json"]
+    assert accepted_media_types("text/plain, application/json") == ["text/plain", "application/json"]
+    assert accepted_media_types("text/plain;q=0.5, application/json") == ["application/json", "text/plain"]
+    assert accepted_media_types("text/yaml; charset=utf-8;q=0.9, */*;q=0.1") == ["text/yaml", "*/*"]
+    # q=0 means not acceptable
+    assert accepted_media_types("application/json;q=0, text/plain") == ["text/plain"]
+
+
+def test_is_large_result() -> None:
+    assert not is_large_result("test")
+    assert not is_large_result(list(range(101)))
+    assert is_large_result(list(range(1001)))
+    # few top level entries with large content
+    assert is_large_result({"a": "x" * 100_000})
+    assert is_large_result({"a": [{"b": i} for i in range(600)]})
+
+
+def test_del_paths_in_trie() -> None:
+    trie = path_trie([["a"], ["b", "c"], ["b", "d"]])
+    assert trie == {"a": None, "b": {"c": None, "d": None}}
+    js = {"a": 1, "b": {"c": 2, "d": 3, "e": 4}, "f": 5}
+    del_paths_in_trie(js, trie)
+    assert js == {"b": {"e": 4}, "f": 5}
+    # same as del_value_in_path: an empty parent is set to None
+    js = {"b": {"c": 2}}
+    del_paths_in_trie(js, trie)
+    assert js == {"b": None}
@@ -8,8 +8,22 @@ from copy import deepcopy
 from datetime import datetime, timezone, timedelta
 from enum import Enum, StrEnum, unique
 from functools import wraps, cached_property
-from typing import Dict, Iterator, List, ClassVar, Optional, TypedDict, Any, TypeVar, Type, Callable, Set, Tuple
-from collections import defaultdict
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    ClassVar,
+    Optional,
+    TypedDict,
+    Any,
+    TypeVar,
+    Type,
+    Callable,
+    FrozenSet,
+    Tuple,
+    Deque,
+)
+from collections import defaultdict, deque
 
 from attr import resolve_types
 from attrs import define, field, Factory, frozen, evolve
@@ -36,11 +50,10 @@ metrics_resource_cleanup = Summary("fix_resource_cleanup_seconds", "Time it took
 
 
 def unless_protected(f: Callable[..., bool]) -> Callable[..., bool]:
+    # Only used on methods of BaseResource: read the protected flag directly, without a type check per call.
     @wraps(f)
-    def wrapper(self: Any, *args: Any, **kwargs: Any) -> bool:
-        if not isinstance(self, BaseResource):
-            raise ValueError("unless_protected() only supports BaseResource type objects")
-        if self.protected:
+    def wrapper(self: BaseResource, *args: Any, **kwargs: Any) -> bool:
+        if self._protected:
             log.error(f"Resource {self.rtdname} is protected - refusing modification")
             self.log(("Modification was requested even though resource is protected" " - refusing"))
             return False
@@ -79,21 +92,28 @@ class EdgeType(Enum):
         return EdgeType.default
 
 
+no_changes: FrozenSet[str] = frozenset()
+
+
 class ResourceChanges:
+    # one instance per resource: avoid the per instance __dict__
+    __slots__ = ("node", "reported", "desired", "metadata", "changed")
+
     def __init__(self, node: BaseResource) -> None:
         self.node = node
-        self.reported: Set[str] = set()
-        self.desired: Set[str] = set()
-        self.metadata: Set[str] = set()
+        # Most resources never change: share one empty set, instead of allocating sets per resource.
+        self.reported: FrozenSet[str] = no_changes
+        self.desired: FrozenSet[str] = no_changes
+        self.metadata: FrozenSet[str] = no_changes
         self.changed = False
 
     def add(self, property: str) -> None:
         if property == "tags":
-            self.reported.add(property)
+            self.reported = self.reported | {property}
         elif property == "clean":
-            self.desired.add(property)
+            self.desired = self.desired | {property}
         elif property in ("cleaned", "protected"):
-            self.metadata.add(property)
+            self.metadata = self.metadata | {property}
         elif property == "log":
             pass
         else:
@@ -245,6 +265,9 @@ class StatName(str, Enum):
 
 MetricNameWithUnit = str
 
+# Maximum number of entries kept in the event log of a resource.
+MaxEventLogEntries = 1000
+
 
 @define(eq=False, slots=False, kw_only=True)
 class BaseResource(ABC):
@@ -324,7 +347,8 @@ class BaseResource(ABC):
             self.name = self.id
         self._changes: ResourceChanges = ResourceChanges(self)
         self.__graph = None
-        self.__log: List[Json] = []
+        # Created on the first log entry: most resources never log, and an empty deque is much larger than None.
+        self.__log: Optional[Deque[Json]] = None
         self._raise_tags_exceptions: bool = False
         if not hasattr(self, "_ctime"):
             self._ctime = None
@@ -332,6 +356,7 @@ class BaseResource(ABC):
             self._atime = None
         if not hasattr(self, "_mtime"):
             self._mtime = None
+        self._ctime_tag: Tuple[Optional[str], Optional[datetime]] = (None, None)
 
     def _keys(self) -> Tuple[Any, ...]:
         """Return a tuple of all keys that make this resource unique
@@ -375,8 +400,11 @@ class BaseResource(ABC):
             "timestamp": now,
             "msg": str(msg),
             "exception": repr(exception) if exception else None,
-            "data": deepcopy(data),
+            "data": deepcopy(data) if data is not None else None,
         }
+        if self.__log is None:
+            # Long-lived resources should not grow their event log without limit: the oldest entries are dropped.
+            self.__log = deque(maxlen=MaxEventLogEntries)
         self.__log.append(log_entry)
         self._changes.add("log")
 
@@ -389,7 +417,7 @@ class BaseResource(ABC):
 
     @property
     def event_log(self) -> List[Json]:
-        return self.__log
+        return list(self.__log) if self.__log is not None else []
 
     @property
     def str_event_log(self) -> List[Json]:
@@ -399,7 +427,7 @@ class BaseResource(ABC):
                 "msg": le["msg"],
                 "exception": le["exception"],
             }
-            for le in self.__log
+            for le in self.__log or ()
         ]
 
     def update_tag(self, key: str, value: str) -> bool:
@@ -443,10 +471,16 @@ class BaseResource(ABC):
 
     def _ctime_getter(self) -> Optional[datetime]:
         if ctime_string := self.tags.get("fix:ctime"):
-            try:
-                return make_valid_timestamp(datetime.fromisoformat(ctime_string))
-            except ValueError:
-                pass
+            # the tag is parsed only once, as long as the tag value does not change
+            tag_string, tag_ctime = self._ctime_tag
+            if ctime_string != tag_string:
+                try:
+                    tag_ctime = make_valid_timestamp(datetime.fromisoformat(ctime_string))
+                except ValueError:
+                    tag_ctime = None
+                self._ctime_tag = (ctime_string, tag_ctime)
+            if tag_ctime is not None:
+                return tag_ctime
         return self._ctime
 
     def _ctime_setter(self, value: Optional[datetime]) -> None:
@@ -666,21 +700,29 @@ class BaseResource(ABC):
     ) -> None:
         self._deferred_connections.append({"search": search, "parent": parent, "edge_type": edge_type})
 
+    def pop_deferred_connections(self) -> List[Dict[str, Any]]:
+        """Return all pending deferred connections of this node and remove them from the node"""
+        pending = self._deferred_connections
+        if pending:
+            self._deferred_connections = []
+        return pending
+
     def resolve_deferred_connections(self, graph: Any) -> None:
         if graph is None:
             graph = self._graph
-        while self._deferred_connections:
-            dc = self._deferred_connections.pop(0)
-            node = graph.search_first_all(dc["search"])
-            edge_type = dc["edge_type"]
-            if node:
-                if dc["parent"]:
-                    src = node
-                    dst = self
-                else:
-                    src = self
-                    dst = node
-                graph.add_edge(src, dst, edge_type=edge_type)
+        # take all pending connections at once: popping from the front of the list is O(n) for every element
+        while pending := self.pop_deferred_connections():
+            for dc in pending:
+                node = graph.search_first_all(dc["search"])
+                edge_type = dc["edge_type"]
+                if node:
+                    if dc["parent"]:
+                        src = node
+                        dst = self
+                    else:
+                        src = self
+                        dst = node
+                    graph.add_edge(src, dst, edge_type=edge_type)
 
     def predecessors(self, graph: Optional[Any] = None, edge_type: Optional[EdgeType] = None) -> Iterator[BaseResource]:
         """Returns an iterator of the node's parent nodes"""
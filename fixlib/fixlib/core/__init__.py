@@ -1,6 +1,7 @@
 import time
 import requests
 import warnings
+from requests.adapters import HTTPAdapter, Retry
 from fixlib.logger import log
 from fixlib.args import ArgumentParser
 from urllib.parse import urlparse, ParseResult
@@ -33,12 +34,39 @@ def add_args(arg_parser: ArgumentParser) -> None:
     )
 
 
-def fixcore_is_up(fixcore_uri: str, timeout: int = 5, headers: Optional[Dict[str, str]] = None) -> bool:
+def http_session(pool_maxsize: int = 10, retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Create a session that keeps connections to fixcore alive and reuses them.
+    Idempotent requests are retried with backoff, if the connection fails or fixcore is temporarily unavailable.
+    Note: a session is not guaranteed to be thread safe - use one session per thread.
+    """
+    retry_strategy = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        # hand the last response to the caller instead of raising, once all retries are used up
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry_strategy)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fixcore_is_up(
+    fixcore_uri: str,
+    timeout: int = 5,
+    headers: Optional[Dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
+) -> bool:
     ready_uri = f"{fixcore_uri}/system/ready"
     try:
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            response = requests.get(ready_uri, timeout=timeout, verify=False, headers=headers)
+            get = session.get if session is not None else requests.get
+            response = get(ready_uri, timeout=timeout, verify=False, headers=headers)
             if response.status_code == 200:
                 return True
     except Exception:
@@ -52,16 +80,18 @@ def wait_for_fixcore(fixcore_uri: str, timeout: int = 300, headers: Optional[Dic
     wait_time: float = -1
     remaining_wait: float = timeout
     waitlog = log.info
-    while wait_time < timeout:
-        if fixcore_is_up(fixcore_uri, headers=headers):
-            core_up = True
-            break
-        else:
-            waitlog(f"Waiting up to {remaining_wait:.2f}s for fixcore" f" to come online at {fixcore_uri}")
-            waitlog = log.debug
-        time.sleep(2)
-        wait_time = time.time() - start_time
-        remaining_wait = timeout - wait_time
+    # poll via a single session, so the connection to fixcore is reused once it is up
+    with requests.Session() as session:
+        while wait_time < timeout:
+            if fixcore_is_up(fixcore_uri, headers=headers, session=session):
+                core_up = True
+                break
+            else:
+                waitlog(f"Waiting up to {remaining_wait:.2f}s for fixcore" f" to come online at {fixcore_uri}")
+                waitlog = log.debug
+            time.sleep(2)
+            wait_time = time.time() - start_time
+            remaining_wait = timeout - wait_time
     if not core_up:
         raise TimeoutError(f"fixcore not ready after {wait_time:.2f} seconds")
 
@@ -4,7 +4,7 @@ from datetime import datetime, date, timedelta
 from enum import Enum
 from functools import lru_cache, reduce
 from pydoc import locate
-from typing import List, MutableSet, Union, Tuple, Dict, Set, Any, TypeVar, Type, Optional
+from typing import List, MutableSet, Union, Tuple, Dict, Set, Any, TypeVar, Type, Optional, FrozenSet
 from typing import get_args, get_origin
 
 import attrs
@@ -391,16 +391,14 @@ def node_from_dict(node_data: Json, include_select_ancestors: bool = False) -> B
     if node_data_ancestors is None:
         node_data_ancestors = {}
 
-    new_node_data = dict(node_data_reported)
-    if "kind" in new_node_data:
-        del new_node_data["kind"]
-
     python_type = node_data_metadata.get("python_type", "NoneExisting")
     node_type = locate_python_type(python_type)
     if node_type is None:
         raise ValueError(f"Do not know how to handle {node_data_reported}")
 
-    cleanup_node_field_types(node_type, new_node_data)
+    # only take the properties known to the node type (kind is derived from the type)
+    field_names = node_field_names(node_type)
+    new_node_data = {k: v for k, v in node_data_reported.items() if k in field_names and k != "kind"}
     ancestors = {}
     if include_select_ancestors:
         for ancestor in ("cloud", "account", "region", "zone"):
@@ -429,8 +427,6 @@ def node_from_dict(node_data: Json, include_select_ancestors: bool = False) -> B
     return node
 
 
-def cleanup_node_field_types(node_type: BaseResource, node_data_reported: Json) -> None:
-    valid_fields = set(field.name for field in attrs.fields(node_type))  # type: ignore
-    for field_name in list(node_data_reported.keys()):
-        if field_name not in valid_fields:
-            del node_data_reported[field_name]
+@lru_cache(maxsize=None)
+def node_field_names(node_type: Type[BaseResource]) -> FrozenSet[str]:
+    return frozenset(field.name for field in attrs.fields(node_type))
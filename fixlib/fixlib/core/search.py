@@ -1,5 +1,6 @@
 import json
-from typing import Optional, Iterator, Dict, Any
+from types import TracebackType
+from typing import Optional, Iterator, Dict, Any, Type
 from urllib.parse import urlencode
 
 import requests
@@ -7,7 +8,7 @@ import requests
 from fixlib.args import ArgumentParser
 from fixlib.baseresources import EdgeType
 from fixlib.config import Config
-from fixlib.core import fixcore
+from fixlib.core import fixcore, http_session
 from fixlib.core.ca import TLSData
 from fixlib.core.model_export import node_from_dict, node_to_dict
 from fixlib.graph import Graph, sanitize
@@ -15,6 +16,9 @@ from fixlib.jwt import encode_jwt_to_headers
 from fixlib.logger import log
 from fixlib.types import Json
 
+# read the streamed ndjson response in large chunks, instead of the requests default of 512 bytes
+ResponseChunkSize = 64 * 1024
+
 
 class CoreGraph:
     def __init__(
@@ -36,6 +40,22 @@ class CoreGraph:
             self.verify = tls_data.ca_cert_path
         self.graph_uri = f"{self.base_uri}/graph/{self.graph_name}"
         self.search_uri = f"{self.graph_uri}/search/graph"
+        # all requests of this instance reuse the same connection pool: use close() or a with block to release it
+        self.session = http_session()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "CoreGraph":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def execute(self, command: str) -> Iterator[Json]:
         log.debug(f"Executing command: {command}")
@@ -57,19 +77,19 @@ class CoreGraph:
         search_endpoint += f"?{query_string}"
         return self.post(search_endpoint, search, headers, verify=self.verify)
 
-    @staticmethod
-    def post(uri: str, data: str, headers: Dict[str, str], verify: Optional[str] = None) -> Iterator[Json]:
+    def post(self, uri: str, data: str, headers: Dict[str, str], verify: Optional[str] = None) -> Iterator[Json]:
         if getattr(ArgumentParser.args, "psk", None):
             encode_jwt_to_headers(headers, {}, ArgumentParser.args.psk)
-        r = requests.post(uri, data=data, headers=headers, stream=True, verify=verify)
+        r = self.session.post(uri, data=data, headers=headers, stream=True, verify=verify)
         if r.status_code != 200:
             log.error(r.content.decode())
             raise RuntimeError(f"Failed to search graph: {r.content.decode()}")
-        for line in r.iter_lines():
+        for line in r.iter_lines(chunk_size=ResponseChunkSize):
             if not line:
                 continue
             try:
-                response: Json = json.loads(line.decode("utf-8"))
+                # json parses the bytes directly. orjson is not used: it turns int > 64 bit into float.
+                response: Json = json.loads(line)
                 yield response
             except TypeError as e:
                 log.error(e)
@@ -112,7 +132,7 @@ class CoreGraph:
         if getattr(ArgumentParser.args, "psk", None):
             encode_jwt_to_headers(headers, {}, ArgumentParser.args.psk)
 
-        r = requests.patch(
+        r = self.session.patch(
             f"{self.graph_uri}/nodes",
             data=GraphChangeIterator(graph),
             headers=headers,
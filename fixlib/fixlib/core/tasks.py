@@ -4,6 +4,7 @@ import json
 import queue
 import threading
 import time
+from collections import defaultdict
 from typing import Callable, Dict, Optional, List, Any
 from urllib.parse import urlunsplit, urlsplit
 
@@ -118,6 +119,10 @@ class CoreTasks(threading.Thread):
         self.identifier = identifier
         self.fixcore_ws_uri = fixcore_ws_uri
         self.task_handler = task_handler
+        # lookup handlers by task name, so a worker only checks the handlers that can match
+        self.task_handler_by_name: Dict[str, List[CoreTaskHandler]] = defaultdict(list)
+        for handler in task_handler:
+            self.task_handler_by_name[handler.name].append(handler)
         self.max_workers = max_workers
         self.tls_data = tls_data
         self.ws: Optional[WebSocketApp] = None
@@ -150,13 +155,14 @@ class CoreTasks(threading.Thread):
         while not self.shutdown_event.is_set():
             message = self.queue.get()
             log.debug(f"{self.identifier} received: {message}")
-            for handler in self.task_handler:
+            for handler in self.task_handler_by_name.get(message.get("task_name"), []):
                 if handler.matches(message):
                     try:
                         result = handler.execute(message)
                         if self.ws:
-                            log.debug(f"Sending reply {result.to_json()}")
-                            self.ws.send(json.dumps(result.to_json()))
+                            reply = result.to_json()
+                            log.debug("Sending reply %s", reply)
+                            self.ws.send(json.dumps(reply))
                     except Exception as ex:
                         log.exception(f"Something went wrong while processing {message}")
                         if (task_id := message.get("task_id")) and self.ws is not None:
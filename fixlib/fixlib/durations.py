@@ -1,6 +1,6 @@
 import operator
 from datetime import timedelta
-from functools import reduce
+from functools import reduce, lru_cache
 import re
 from itertools import chain
 from typing import Union, List, Optional, cast
@@ -60,6 +60,8 @@ single_duration_parser = parsy.seq((float_p | integer_p), time_unit_parser).comb
 duration_parser = single_duration_parser.sep_by(time_unit_combination.optional(), min=1).map(combine_durations)
 
 
+# Node data usually contains only a handful of distinct duration strings, so the parse result is cached.
+@lru_cache(maxsize=1024)
 def parse_duration(ds: str) -> timedelta:
     if __ISO8601_PERIOD_PREFIX.match(ds):
         dr = isodate.parse_duration(ds)
@@ -1,11 +1,11 @@
 import os
 import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from enum import Enum
-from threading import Thread, Lock
-from typing import Callable, Iterable, Any, Dict
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Iterable, Any, Dict, Optional, Mapping, List, Tuple
 
-from fixlib.lock import RWLock
 from fixlib.logger import log
 from fixlib.types import Json
 
@@ -48,15 +48,41 @@ class Event:
         self.data = data
 
 
-_events: Dict[EventType, Dict[Callable[[Event], None], Any]] = defaultdict(dict)
-_events_lock = RWLock()
+# Listeners are registered rarely but events are dispatched often. The listeners of an event type
+# are therefore kept in a read-only mapping that is replaced on every change (copy-on-write):
+# dispatching only needs to grab the current mapping, the lock only serializes writers.
+_events: Dict[EventType, Mapping[Callable[[Event], None], Any]] = {}
+_events_lock = Lock()
+# listeners mostly wait on I/O: use the same pool size as the ThreadPoolExecutor default
+EventWorkers = min(32, (os.cpu_count() or 1) + 4)
+_dispatch_pool: Optional[ThreadPoolExecutor] = None
+_dispatch_pool_pid: Optional[int] = None
+_dispatch_pool_lock = Lock()
+
+
+def dispatch_pool() -> ThreadPoolExecutor:
+    """Return the thread pool event listeners are called in
+
+    The pool is created lazily and recreated after a fork, since worker
+    threads do not survive into the child process.
+    """
+    global _dispatch_pool, _dispatch_pool_pid
+    pid = os.getpid()
+    with _dispatch_pool_lock:
+        if _dispatch_pool is None or _dispatch_pool_pid != pid:
+            _dispatch_pool = ThreadPoolExecutor(max_workers=EventWorkers, thread_name_prefix="event")
+            _dispatch_pool_pid = pid
+        return _dispatch_pool
+
+
+def _log_listener_exception(future: Future[None]) -> None:
+    if (exception := future.exception()) is not None:
+        log.error("Caught unhandled event callback exception", exc_info=exception)
 
 
 def event_listener_registered(event_type: EventType, listener: Callable[[Event], None]) -> bool:
     """Return whether listener is registered to event"""
-    if _events is None:
-        return False
-    return event_type in _events.keys() and listener in _events[event_type].keys()
+    return listener in _events.get(event_type, {})
 
 
 def dispatch_event(event: Event, blocking: bool = False) -> None:
@@ -64,15 +90,14 @@ def dispatch_event(event: Event, blocking: bool = False) -> None:
     waiting_str = "" if blocking else "not "
     log.debug(f"Dispatching event {event.event_type.name} and {waiting_str}waiting for" " listeners to return")
 
-    if event.event_type not in _events.keys():
+    # Event listeners might unregister themselves during event dispatch.
+    # This replaces the mapping in _events, the one we hold here stays unchanged.
+    listeners = _events.get(event.event_type)
+    if not listeners:
         return
 
-    with _events_lock.read_access:
-        # Event listeners might unregister themselves during event dispatch
-        # so we will work on a shallow copy while processing the current event.
-        listeners = dict(_events[event.event_type])
-
-    threads = {}
+    # (future, listener, deadline) of all listeners we need to wait for
+    pending: List[Tuple[Future[None], Callable[[Event], None], float]] = []
     for listener, listener_data in listeners.items():
         try:
             if listener_data["pid"] != os.getpid():
@@ -85,11 +110,10 @@ def dispatch_event(event: Event, blocking: bool = False) -> None:
             log.debug(
                 f"Calling listener {listener} of type {type(listener)}" f" (blocking: {listener_data['blocking']})"
             )
-            thread_name = f"{event.event_type.name.lower()}_event" f"-{getattr(listener, '__name__', 'anonymous')}"
-            t = Thread(target=listener, args=[event], name=thread_name)
+            future = dispatch_pool().submit(listener, event)
+            future.add_done_callback(_log_listener_exception)
             if blocking or listener_data["blocking"]:
-                threads[t] = listener
-            t.start()
+                pending.append((future, listener, time.monotonic() + listener_data["timeout"]))
         except Exception:
             log.exception("Caught unhandled event callback exception")
         finally:
@@ -101,14 +125,12 @@ def dispatch_event(event: Event, blocking: bool = False) -> None:
                 remove_event_listener(event.event_type, listener)
                 listener_data["lock"].release()
 
-    start_time = time.time()
-    for thread, listener in threads.items():
-        timeout = start_time + listeners[listener]["timeout"] - time.time()
-        if timeout < 1:
-            timeout = 1
-        log.debug(f"Waiting up to {timeout:.2f}s for event listener {thread.name} to finish")
-        thread.join(timeout)
-        log.debug(f"Event listener {thread.name} finished (timeout: {thread.is_alive()})")
+    for future, listener, deadline in pending:
+        timeout = max(1.0, deadline - time.monotonic())
+        listener_name = f"{event.event_type.name.lower()}_event-{getattr(listener, '__name__', 'anonymous')}"
+        log.debug(f"Waiting up to {timeout:.2f}s for event listener {listener_name} to finish")
+        wait([future], timeout)
+        log.debug(f"Event listener {listener_name} finished (timeout: {not future.done()})")
 
 
 def add_event_listener(
@@ -124,37 +146,41 @@ def add_event_listener(
         return False
 
     log.debug(f"Registering {listener} with event {event_type.name}" f" (blocking: {blocking}, one-shot: {one_shot})")
-    with _events_lock.write_access:
+    with _events_lock:
         if not event_listener_registered(event_type, listener):
-            _events[event_type][listener] = {
+            listeners = dict(_events.get(event_type, {}))
+            listeners[listener] = {
                 "blocking": blocking,
                 "timeout": timeout,
                 "one-shot": one_shot,
                 "lock": Lock(),
                 "pid": os.getpid(),
             }
+            _events[event_type] = MappingProxyType(listeners)
             return True
         return False
 
 
 def remove_event_listener(event_type: EventType, listener: Callable[[Event], None]) -> bool:
     """Remove an Event Listener"""
-    with _events_lock.write_access:
+    with _events_lock:
         if event_listener_registered(event_type, listener):
             log.debug(f"Removing {listener} from event {event_type.name}")
-            del _events[event_type][listener]
-            if len(_events[event_type]) == 0:
+            listeners = dict(_events[event_type])
+            del listeners[listener]
+            if listeners:
+                _events[event_type] = MappingProxyType(listeners)
+            else:
                 del _events[event_type]
             return True
         return False
 
 
 def list_event_listeners() -> Iterable[str]:
-    with _events_lock.read_access:
-        for event_type, listeners in _events.items():
-            for listener, listener_data in listeners.items():
-                yield (
-                    f"{event_type.name}: {listener}, "
-                    f"blocking: {listener_data['blocking']}, "
-                    f"one-shot: {listener_data['one-shot']}"
-                )
+    for event_type, listeners in list(_events.items()):
+        for listener, listener_data in listeners.items():
+            yield (
+                f"{event_type.name}: {listener}, "
+                f"blocking: {listener_data['blocking']}, "
+                f"one-shot: {listener_data['one-shot']}"
+            )
@@ -9,12 +9,12 @@ from datetime import datetime
 from enum import Enum
 from functools import lru_cache
 from time import time
-from typing import Dict, Iterator, List, Tuple, Optional, Union, Any, Type, TypeVar, Set, Iterable
+from typing import Dict, Iterator, List, Tuple, Optional, Union, Any, Type, TypeVar, Set, Iterable, Callable
 
 import networkx
+import orjson
 from attr import resolve_types
 from attrs import define, fields
-from networkx.algorithms.dag import is_directed_acyclic_graph
 from prometheus_client import Summary
 from typeguard import check_type
 
@@ -35,7 +35,7 @@ from fixlib.core.model_export import (
     dataclasses_to_fixcore_model,
     dynamic_object_to_fixcore_model,
 )
-from fixlib.json import to_json_str
+from fixlib.json import to_json
 from fixlib.logger import log
 from fixlib.types import Json
 from fixlib.utils import get_resource_attributes, unset_cached_properties, utc_str
@@ -55,6 +55,9 @@ class ByNodeId:
 
 NodeSelector = Union[ByNodeId, BySearchCriteria]
 
+# the exported graph is written to a temporary file with this buffer size
+TempfileBufferSize = 1024 * 1024
+
 
 metrics_graph_search = Summary("fix_graph_search_seconds", "Time it took the Graph search() method")
 metrics_graph_searchall = Summary("fix_graph_searchall_seconds", "Time it took the Graph searchall() method")
@@ -129,6 +132,24 @@ class Graph(networkx.MultiDiGraph):  # type: ignore
         if not skip_deferred_edges:
             self.resolve_deferred_connections()
 
+    def attach_to_root(self, root: BaseResource) -> None:
+        """Make the given node the new root of this graph
+
+        The current root is connected to the new root. This has the same effect as merging
+        this graph into a new graph with the given root, but does not copy any nodes or edges.
+        """
+        previous_root = self.root
+        # the merged graph would not have any node limit
+        self.max_nodes = None
+        self.root = root
+        self.add_node(root, label=root.name, **get_resource_attributes(root))
+        if isinstance(previous_root, BaseResource):
+            log.debug(f"Attaching graph of {previous_root.kdname} to {root.kdname}")
+            self.add_edge(root, previous_root)
+        else:
+            log.warning("Merging graphs with no valid roots")
+        self.resolve_deferred_connections()
+
     def add_resource(
         self,
         parent: BaseResource,
@@ -254,10 +275,28 @@ class Graph(networkx.MultiDiGraph):  # type: ignore
                 yield successor
 
     def ancestors(self, node: BaseResource, edge_type: Optional[EdgeType] = None) -> Iterator[BaseResource]:
-        return networkx.algorithms.dag.ancestors(self.edge_type_subgraph(edge_type), node)  # type: ignore
+        return self.__reachable(node, self.predecessors, edge_type)
 
     def descendants(self, node: BaseResource, edge_type: Optional[EdgeType] = None) -> Iterator[BaseResource]:
-        return networkx.algorithms.dag.descendants(self.edge_type_subgraph(edge_type), node)  # type: ignore
+        return self.__reachable(node, self.successors, edge_type)
+
+    @staticmethod
+    def __reachable(
+        node: BaseResource,
+        neighbors: Callable[[BaseResource, Optional[EdgeType]], Iterator[BaseResource]],
+        edge_type: Optional[EdgeType],
+    ) -> Iterator[BaseResource]:
+        # Breadth first walk, that only visits the reachable part of the graph.
+        # Nodes are yielded as they are found, so callers that stop early do not pay for the whole walk.
+        seen = {node}
+        todo = deque([node])
+        while todo:
+            current = todo.popleft()
+            for neighbor in neighbors(current, edge_type):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    todo.append(neighbor)
+                    yield neighbor
 
     def edge_type_subgraph(self, edge_type: Optional[EdgeType] = None) -> networkx.Graph:
         if edge_type is None:
@@ -290,8 +329,9 @@ class Graph(networkx.MultiDiGraph):  # type: ignore
                 key: EdgeKey = edge[2]
                 edges_per_type[key.edge_type].append(edge)
         for edges in edges_per_type.values():
-            typed_graph = self.edge_subgraph(edges)
-            if not is_directed_acyclic_graph(typed_graph):
+            # only create the (slow) subgraph view, if there is a cycle to report
+            if has_cycle(edges):
+                typed_graph = self.edge_subgraph(edges)
                 return [edge[2] for edge in networkx.algorithms.cycles.find_cycle(typed_graph)]
         return None
 
@@ -367,9 +407,43 @@ class Graph(networkx.MultiDiGraph):  # type: ignore
     @metrics_graph_resolve_deferred_connections.time()
     def resolve_deferred_connections(self) -> None:
         log.debug("Resolving deferred graph connections")
-        for node in self.nodes:
-            if isinstance(node, BaseResource):
-                node.resolve_deferred_connections(self)
+        # All pending connections are resolved as batch: searches are answered from an index over all nodes,
+        # instead of walking the complete graph for every single connection.
+        # Resolving connections might add new ones, so repeat until nothing is pending.
+        while True:
+            pending: List[Tuple[BaseResource, Dict[str, Any]]] = []
+            for node in self.nodes:
+                if isinstance(node, BaseResource) and (dcs := node.pop_deferred_connections()):
+                    pending.extend((node, dc) for dc in dcs)
+            if not pending:
+                return
+            indexes = self.__search_indexes({tuple(dc["search"].keys()) for _, dc in pending})
+            for node, dc in pending:
+                search: Dict[str, Any] = dc["search"]
+                try:
+                    found = indexes[tuple(search.keys())].get(tuple(search.values()))
+                except TypeError:  # search values are not hashable
+                    found = self.search_first_all(search)
+                if found:
+                    src, dst = (found, node) if dc["parent"] else (node, found)
+                    self.add_edge(src, dst, edge_type=dc["edge_type"])
+
+    def __search_indexes(
+        self, searches: Set[Tuple[str, ...]]
+    ) -> Dict[Tuple[str, ...], Dict[Tuple[Any, ...], BaseResource]]:
+        # For every searched combination of attribute names: map the values of these attributes
+        # to the first node with these values (same as searchall).
+        # Only the attributes that are searched are read, and all indexes are built in one pass over the nodes.
+        indexes: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], BaseResource]] = {attrs: {} for attrs in searches}
+        attr_names = {attr for attrs in searches for attr in attrs}
+        for node in self.nodes():
+            values = {attr: getattr(node, attr, None) for attr in attr_names}
+            for attrs, index in indexes.items():
+                try:
+                    index.setdefault(tuple(values[attr] for attr in attrs), node)
+                except TypeError:  # values that are not hashable can not match a hashable search
+                    pass
+        return indexes
 
     def export_model(self, **kwargs: Any) -> List[Json]:
         return export_model(graph=self, **kwargs)
@@ -378,6 +452,31 @@ class Graph(networkx.MultiDiGraph):  # type: ignore
         return GraphExportIterator(self)
 
 
+def has_cycle(edges: Iterable[Tuple[Any, Any, Any]]) -> bool:
+    """
+    Check if the given edges contain a cycle.
+    Uses Kahn's algorithm on plain dicts, which is a lot faster than walking a networkx subgraph view.
+    :param edges: the edges as (from, to, key) tuples.
+    :return: True if the edges form at least one cycle, otherwise False.
+    """
+    successors: Dict[Any, List[Any]] = defaultdict(list)
+    in_degree: Dict[Any, int] = defaultdict(int)
+    for src, dst, _ in edges:
+        successors[src].append(dst)
+        in_degree[dst] += 1
+    ready = [node for node in successors if node not in in_degree]
+    visited = 0
+    while ready:
+        node = ready.pop()
+        visited += 1
+        for succ in successors.get(node, ()):
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                ready.append(succ)
+    # all nodes without cycle are visited eventually
+    return visited < len(successors.keys() | in_degree.keys())
+
+
 def resource_classes_to_fixcore_model(classes: Set[Type[Any]], **kwargs: Any) -> List[Json]:
     model = {c["fqn"]: c for c in dataclasses_to_fixcore_model(classes, **kwargs)}
     # create a phantom resource which defines default property paths
@@ -547,6 +646,17 @@ def sanitize(graph: Graph, maybe_root: Optional[GraphRoot] = None) -> None:
     validate_graph_dataclasses_and_nodes(graph)
 
 
+def ndjson_line(js: Json) -> bytes:
+    """
+    Encode the given json as single line of ndjson, including the trailing newline.
+    """
+    try:
+        return orjson.dumps(js, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson does not support all values, e.g. integers beyond 64 bit
+        return (json.dumps(js) + "\n").encode()
+
+
 class GraphMergeKind(Enum):
     cloud = "cloud"
     account = "account"
@@ -559,14 +669,18 @@ class GraphExportIterator:
         delete_tempfile: bool = True,
         tempdir: Optional[str] = None,
         graph_merge_kind: GraphMergeKind = GraphMergeKind.cloud,
+        chunk_size: int = 0,
     ):
         self.graph = graph
+        # lines are yielded one by one, unless a chunk size is given: lines are combined into chunks of this size
+        self.chunk_size = chunk_size
         ts = datetime.now().strftime("%Y-%m-%d-%H-%M")
         self.tempfile = tempfile.NamedTemporaryFile(
             prefix=f"fix-graph-{ts}-",
             suffix=".ndjson",
             delete=delete_tempfile,
             dir=tempdir,
+            buffering=TempfileBufferSize,
         )
         if not delete_tempfile:
             log.info(f"Writing graph json to file {self.tempfile.name}")
@@ -607,6 +721,7 @@ class GraphExportIterator:
         report_every = round(self.total_lines / 10)
 
         self.tempfile.seek(0)
+        chunk = bytearray()
         while line := self.tempfile.readline():
             lines_sent += 1
             if report_every > 0 and lines_sent > 0 and lines_sent % report_every == 0:
@@ -614,7 +729,15 @@ class GraphExportIterator:
                 elapsed = time() - last_sent
                 log.debug(f"Sent {lines_sent}/{self.total_lines} nodes and edges ({percent}%) - {elapsed:.4f}s")
                 last_sent = time()
-            yield line
+            if self.chunk_size > 0:
+                chunk += line
+                if len(chunk) >= self.chunk_size:
+                    yield bytes(chunk)
+                    chunk.clear()
+            else:
+                yield line
+        if chunk:
+            yield bytes(chunk)
         elapsed = time() - start_time
         log.info(
             f"Sent {lines_sent}/{self.total_lines},"
@@ -639,8 +762,7 @@ class GraphExportIterator:
                     if "metadata" not in node_dict or not isinstance(node_dict["metadata"], dict):
                         node_dict["metadata"] = {}
                     node_dict["metadata"]["exported_at"] = utc_str()
-                node_json = to_json_str(node_dict) + "\n"
-                self.tempfile.write(node_json.encode())
+                self.tempfile.write(ndjson_line(to_json(node_dict)))
                 self.total_lines += 1
             elapsed_nodes = time() - start_time
             log.debug(f"Exported {self.number_of_nodes} nodes in {elapsed_nodes:.4f}s")
@@ -659,8 +781,7 @@ class GraphExportIterator:
                 if reported := data.get("reported"):
                     edge_dict["reported"] = reported
 
-                edge_json = json.dumps(edge_dict) + "\n"
-                self.tempfile.write(edge_json.encode())
+                self.tempfile.write(ndjson_line(edge_dict))
                 self.total_lines += 1
             for from_selector, to_selector, edge_type in self.graph.deferred_edges:
                 deferred_edge_dict: Json = {}
@@ -673,8 +794,7 @@ class GraphExportIterator:
                 else:
                     deferred_edge_dict["to_selector"] = {"search_criteria": to_selector.query}
                 deferred_edge_dict["edge_type"] = edge_type.value
-                deferred_edge_json = json.dumps(deferred_edge_dict) + "\n"
-                self.tempfile.write(deferred_edge_json.encode())
+                self.tempfile.write(ndjson_line(deferred_edge_dict))
                 self.total_lines += 1
             elapsed_edges = time() - start_time
             log.debug(f"Exported {self.number_of_edges} edges in {elapsed_edges:.4f}s")
@@ -65,6 +65,15 @@ def timedelta_from_json(js: Any) -> timedelta:
         raise ValueError(f"Cannot convert {js} to timedelta")
 
 
+# datetime.fromisoformat is implemented in C and understands the ISO 8601 formats we usually see (including Z).
+# isoparse is only used as fallback for formats not supported by fromisoformat.
+def datetime_from_json(js: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(js)
+    except ValueError:
+        return isoparse(js)
+
+
 __converter.register_structure_hook_func(is_primitive_or_primitive_union, lambda v, ty: v)
 
 
@@ -87,7 +96,7 @@ def register_json(
 
 
 # Register some default types not covered in cattrs
-register_json(datetime, utc_str, isoparse)
+register_json(datetime, utc_str, datetime_from_json)
 register_json(date, lambda obj: obj.isoformat(), date.fromisoformat)
 register_json(timedelta, duration_str, timedelta_from_json)
 
@@ -1,4 +1,5 @@
 import gc
+import logging
 import os
 import re
 import time
@@ -324,6 +325,9 @@ def get_stats() -> Dict:
 
 
 def log_stats(graph=None, garbage_collector_stats: bool = False) -> None:
+    # get_stats() walks /proc for every process and file descriptor - only pay for it if the result is logged
+    if not log.isEnabledFor(logging.DEBUG):
+        return
     stats = get_stats()
     try:
         log.debug(
@@ -1,4 +1,5 @@
 import hashlib
+import math
 import os
 import random
 import re
@@ -11,6 +12,7 @@ from contextlib import closing
 from copy import deepcopy
 from datetime import date, datetime, timezone, timedelta
 from functools import wraps, cached_property
+from itertools import islice
 from tarfile import TarFile, TarInfo
 from typing import (
     Dict,
@@ -24,6 +26,7 @@ from typing import (
     Callable,
     cast,
     Iterator,
+    Iterable,
     TypeVar,
     Sequence,
 )
@@ -69,15 +72,13 @@ def parse_utc(date_string: str) -> datetime:
 
 
 def make_valid_timestamp(timestamp: datetime) -> Optional[datetime]:
-    if not isinstance(timestamp, datetime) and isinstance(timestamp, date):
-        timestamp = datetime.combine(timestamp, datetime.min.time()).replace(tzinfo=timezone.utc)
-    elif isinstance(timestamp, datetime) and timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=timezone.utc)
-    elif isinstance(timestamp, datetime):
-        pass
+    # check the common case of a timezone aware datetime first
+    if isinstance(timestamp, datetime):
+        return timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=timezone.utc)
+    elif isinstance(timestamp, date):
+        return datetime(timestamp.year, timestamp.month, timestamp.day, tzinfo=timezone.utc)
     else:
-        timestamp = None
-    return timestamp
+        return None
 
 
 def get_local_tzinfo() -> ZoneInfo:
@@ -87,11 +88,19 @@ def get_local_tzinfo() -> ZoneInfo:
     return ZoneInfo(zone_name)
 
 
-def chunks(items: List[T], n: int) -> Iterator[List[T]]:
-    """Split a list of items into multiple lists of size n and yield each chunk"""
-    for s in range(0, len(items), n):
-        e = s + n
-        yield items[s:e]
+def chunks(items: Iterable[T], n: int) -> Iterator[List[T]]:
+    """Split items into multiple lists of size n and yield each chunk
+
+    Lists are sliced directly, any other iterable is consumed lazily without materializing it first.
+    """
+    if isinstance(items, list):
+        for s in range(0, len(items), n):
+            e = s + n
+            yield items[s:e]
+    else:
+        it = iter(items)
+        while chunk := list(islice(it, n)):
+            yield chunk
 
 
 def unset_cached_properties(obj: Any) -> None:
@@ -107,13 +116,16 @@ def unset_cached_properties(obj: Any) -> None:
             obj.__dict__.pop(attr_a.attrname, None)
 
 
-# via https://stackoverflow.com/a/1094933
+IecUnits = ("B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB")
+
+
 def iec_size_format(byte_size: float) -> str:
-    for unit in ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB"]:
-        if abs(byte_size) < 1024.0:
-            return f"{byte_size:.2f} {unit}"
-        byte_size /= 1024.0
-    return f"{byte_size:.2f} YiB"
+    if not math.isfinite(byte_size):
+        # inf and nan have no bit length: they end up in the largest unit
+        return f"{byte_size:.2f} {IecUnits[-1]}"
+    # every unit is 2^10 times the previous one: the unit index follows from the bit length
+    exponent = min((int(abs(byte_size)).bit_length() - 1) // 10, len(IecUnits) - 1) if abs(byte_size) >= 1024 else 0
+    return f"{byte_size / (1 << (10 * exponent)):.2f} {IecUnits[exponent]}"
 
 
 # via https://stackoverflow.com/a/44873382
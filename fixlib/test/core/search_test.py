@@ -0,0 +1,30 @@
+from typing import Any, Iterator, List
+
+from fixlib.core.search import CoreGraph
+
+
+class ResponseMock:
+    def __init__(self, lines: List[bytes]) -> None:
+        self.status_code = 200
+        self.lines = lines
+
+    def iter_lines(self, **kwargs: Any) -> Iterator[bytes]:
+        return iter(self.lines)
+
+
+class SessionMock:
+    def __init__(self, lines: List[bytes]) -> None:
+        self.lines = lines
+
+    def post(self, *args: Any, **kwargs: Any) -> ResponseMock:
+        return ResponseMock(self.lines)
+
+
+def test_post_keeps_large_integers() -> None:
+    large = 2**64 + 1
+    core_graph = CoreGraph(base_uri="http://localhost:8900", graph="test")
+    lines = [b'{"id": "a", "size": %d}' % large, b"", b'{"id": "b", "size": 1}']
+    core_graph.session = SessionMock(lines)  # type: ignore
+    result = list(core_graph.post("http://localhost:8900/search", "all", {}))
+    assert result == [{"id": "a", "size": large}, {"id": "b", "size": 1}]
+    assert isinstance(result[0]["size"], int)
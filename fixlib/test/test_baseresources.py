@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 from typing import ClassVar
 from attrs import define
-from fixlib.baseresources import BaseResource
+from fixlib.baseresources import BaseResource, MaxEventLogEntries
 
 
 @define(eq=False, slots=False)
@@ -20,3 +21,25 @@ def test_resource():
     assert r.kind == "some_test_resource"
     assert r.tags["foo"] == "bar"
     assert r.event_log[0]["msg"] == log_msg
+
+
+def test_ctime_from_tag():
+    ctime = datetime(2023, 1, 2, tzinfo=timezone.utc)
+    r = SomeTestResource(id="foo", tags={}, ctime=ctime)
+    assert r.ctime == ctime
+    r.tags["fix:ctime"] = "2023-02-03T00:00:00+00:00"
+    assert r.ctime == datetime(2023, 2, 3, tzinfo=timezone.utc)
+    # a changed tag value is picked up
+    r.tags["fix:ctime"] = "2023-03-04T00:00:00+00:00"
+    assert r.ctime == datetime(2023, 3, 4, tzinfo=timezone.utc)
+    # invalid tag values fall back to the ctime of the resource
+    r.tags["fix:ctime"] = "invalid"
+    assert r.ctime == ctime
+
+
+def test_event_log_is_bounded():
+    r = SomeTestResource(id="foo", tags={})
+    for i in range(MaxEventLogEntries + 10):
+        r.log(f"message {i}")
+    assert len(r.event_log) == MaxEventLogEntries
+    assert r.event_log[0]["msg"] == "message 10"
@@ -1,7 +1,7 @@
 from platform import python_implementation
 
 import pytest
-from fixlib.graph import Graph, GraphExportIterator, EdgeKey, MaxNodesExceeded
+from fixlib.graph import Graph, GraphExportIterator, EdgeKey, MaxNodesExceeded, has_cycle
 from fixlib.baseresources import BaseResource, EdgeType, GraphRoot
 import fixlib.logger as logger
 from attrs import define
@@ -53,6 +53,20 @@ def test_graph_merge():
         assert edge_type == EdgeType.delete
 
 
+def test_graph_attach_to_root():
+    a = SomeTestResource(id="a", tags={})
+    b = SomeTestResource(id="b", tags={})
+    g = Graph(root=a, max_nodes=2)
+    g.add_resource(a, b)
+    root = GraphRoot(id="root", tags={})
+    g.attach_to_root(root)
+    assert g.root is root
+    assert g.max_nodes is None
+    assert len(g.nodes) == 3
+    assert list(g.successors(root)) == [a]
+    assert list(g.successors(a)) == [b]
+
+
 def test_multidigraph():
     g = Graph()
     a = SomeTestResource(id="a", tags={})
@@ -113,6 +127,19 @@ def test_graph_export_iterator():
     assert len(list(gei)) == 3
 
 
+def test_graph_export_iterator_chunks():
+    g = Graph(root=GraphRoot(id="root", tags={}))
+    for i in range(10):
+        g.add_resource(g.root, SomeTestResource(id=f"node{i}", tags={}))
+    lines = list(GraphExportIterator(g))
+    gei = GraphExportIterator(g, chunk_size=1024)
+    chunks = list(gei)
+    # all lines are sent in the same order, but combined into fewer chunks
+    assert b"".join(chunks) == b"".join(lines)
+    assert 1 < len(chunks) < len(lines)
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+
 def test_find_cycles():
     g = Graph()
     n1 = SomeTestResource(id="foo", tags={})
@@ -130,6 +157,30 @@ def test_find_cycles():
     ]
 
 
+def test_resolve_deferred_connections():
+    g = Graph(root=GraphRoot(id="root", tags={}))
+    a = SomeTestResource(id="a", tags={})
+    b = SomeTestResource(id="b", tags={})
+    c = SomeTestResource(id="c", tags={})
+    for node in (a, b, c):
+        g.add_resource(g.root, node)
+    a.add_deferred_connection({"id": "b"})
+    a.add_deferred_connection({"id": "c", "kind": "some_test_resource"}, parent=False, edge_type=EdgeType.delete)
+    b.add_deferred_connection({"id": "does_not_exist"})
+    g.resolve_deferred_connections()
+    assert list(g.predecessors(a)) == [g.root, b]
+    assert list(g.successors(a, edge_type=EdgeType.delete)) == [c]
+    assert list(g.predecessors(b)) == [g.root]
+    assert a._deferred_connections == [] and b._deferred_connections == []
+
+
+def test_has_cycle():
+    assert has_cycle([]) is False
+    assert has_cycle([(1, 2, None), (2, 3, None), (1, 3, None)]) is False
+    assert has_cycle([(1, 2, None), (2, 3, None), (3, 1, None)]) is True
+    assert has_cycle([(1, 1, None)]) is True
+
+
 def test_graph_max_nodes():
     g = Graph(max_nodes=5)
 
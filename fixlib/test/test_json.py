@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import timedelta, datetime, timezone
 from typing import Optional, ClassVar, Union, Literal, Any
 
 from attrs import define
@@ -48,6 +48,15 @@ def test_predefined() -> None:
     roundtrip(Foo("foo", 42, "bar"))
 
 
+def test_datetime() -> None:
+    expected = datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert from_json("2023-01-02T03:04:05Z", datetime) == expected
+    assert from_json("2023-01-02T03:04:05+00:00", datetime) == expected
+    assert from_json("2023-01-02T03:04:05.123456789Z", datetime) == expected.replace(microsecond=123456)
+    # formats not understood by fromisoformat are handled by the fallback
+    assert from_json("2023-01-01T24:00:00Z", datetime) == expected.replace(hour=0, minute=0, second=0)
+
+
 def test_primitive_union() -> None:
     # simple types
     assert is_primitive_or_primitive_union(str) is True
@@ -24,6 +24,8 @@ from fixlib.utils import (
     freeze,
     stdin_generator,
     ensure_bw_compat,
+    iec_size_format,
+    chunks,
 )
 from fixlib.baseresources import BaseResource
 from attrs import define
@@ -232,6 +234,25 @@ def test_ordinal():
     assert ordinal(23) == "23rd"
 
 
+def test_chunks():
+    assert list(chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunks((i for i in range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunks([], 3)) == []
+
+
+def test_iec_size_format():
+    assert iec_size_format(0) == "0.00 B"
+    assert iec_size_format(1023) == "1023.00 B"
+    assert iec_size_format(1024) == "1.00 KiB"
+    assert iec_size_format(1536) == "1.50 KiB"
+    assert iec_size_format(-1024 * 1024) == "-1.00 MiB"
+    assert iec_size_format(5.5 * 1024**3) == "5.50 GiB"
+    assert iec_size_format(2**90) == "1024.00 YiB"
+    assert iec_size_format(float("inf")) == "inf YiB"
+    assert iec_size_format(float("-inf")) == "-inf YiB"
+    assert iec_size_format(float("nan")) == "nan YiB"
+
+
 def test_sha256sum():
     test_string = b"Hello World!"
     expected_sha256sum = "7f83b1657ff1fc53b92dc18148a1d65dfc2d4b1fa3d677284addd200126d9069"
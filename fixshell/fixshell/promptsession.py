@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
 import pathlib
 import re
 import shutil
+import tempfile
 from abc import ABC
+from contextlib import suppress
+from itertools import islice
 from re import Pattern
 from shutil import get_terminal_size
 from typing import Iterable, Optional, List, Dict, Union, Tuple, Callable, Any, Set
@@ -751,13 +755,43 @@ class SafeCompleter(Completer):
             return []
 
 
+# maximum number of commands kept in the history file
+MaxHistoryEntries = 5000
+
+
 class FixHistory(History):
-    def __init__(self, history_file: str) -> None:
+    def __init__(self, history_file: str, max_entries: int = MaxHistoryEntries) -> None:
         super().__init__()
+        self.history_file = history_file
+        self.max_entries = max_entries
         self.file_history = FileHistory(history_file)
 
     def load_history_strings(self) -> Iterable[str]:
-        return self.file_history.load_history_strings()
+        if not os.path.exists(self.history_file):
+            return []
+        # entries are returned newest first
+        entries = self.file_history.load_history_strings()
+        latest = list(islice(entries, self.max_entries))
+        if next(iter(entries), None) is not None:
+            self.truncate(latest)
+        return latest
+
+    def truncate(self, latest: List[str]) -> None:
+        # rewrite the history file with the latest entries only, so it does not grow unbounded.
+        # FileHistory appends to a file: always start with a new, empty temp file in the same directory.
+        tmp_file: Optional[str] = None
+        try:
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(self.history_file) or None, suffix=".tmp")
+            os.close(fd)
+            tmp_history = FileHistory(tmp_file)
+            for entry in reversed(latest):
+                tmp_history.store_string(entry)
+            os.replace(tmp_file, self.history_file)
+        except OSError as ex:
+            log.warning(f"Could not truncate history file {self.history_file}: {ex}")
+            if tmp_file is not None:
+                with suppress(OSError):
+                    os.remove(tmp_file)
 
     def store_string(self, string: str) -> None:
         # called by prompt_toolkit - ignore this call.
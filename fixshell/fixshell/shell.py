@@ -1,3 +1,4 @@
+import codecs
 import os.path
 import re
 import shutil
@@ -178,9 +179,16 @@ class Shell:
             if not first:
                 self.stdout(line_delimiter)
             if isinstance(response, HttpResponse):
-                async for line in response.async_iter_lines():
-                    decoded = line.decode("utf-8")
-                    self.stdout(decoded)
+                # read larger chunks and print all complete lines at once, instead of printing line by line
+                text_response: aiohttp.ClientResponse = response.undrelying
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                rest = ""
+                async for chunk in text_response.content.iter_chunked(64 * 1024):
+                    lines, nl, rest = (rest + decoder.decode(chunk)).rpartition("\n")
+                    if nl:
+                        self.stdout(lines)
+                if rest := rest + decoder.decode(b"", final=True):
+                    self.stdout(rest)
             elif isinstance(response, aiohttp.BodyPartReader):
                 while line := await response.readline():
                     decoded = line.decode("utf-8")
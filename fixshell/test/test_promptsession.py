@@ -1,4 +1,5 @@
 import re
+from pathlib import Path
 from typing import Set
 
 from prompt_toolkit.completion import (
@@ -8,6 +9,7 @@ from prompt_toolkit.completion import (
     NestedCompleter,
 )
 from prompt_toolkit.document import Document
+from prompt_toolkit.history import FileHistory
 
 from fixlib.json import from_json
 from fixshell.promptsession import (
@@ -18,6 +20,7 @@ from fixshell.promptsession import (
     PropertyListCompleter,
     CommandInfo,
     ArgInfo,
+    FixHistory,
 )
 
 known_kinds = ["account", "instance", "instance_type", "network"]
@@ -402,3 +405,22 @@ def test_complete_word() -> None:
     # words
     assert complete("aggregate ", n) == {"avg", "sum", "count"}
     assert complete("aggregate a", n) == {"avg"}
+
+
+def test_history_is_bounded(tmp_path: Path) -> None:
+    history_file = str(tmp_path / "history")
+    assert list(FixHistory(history_file).load_history_strings()) == []
+    file_history = FileHistory(history_file)
+    for num in range(10):
+        file_history.store_string(f"cmd {num}")
+    expected = ["cmd 9", "cmd 8", "cmd 7", "cmd 6"]
+    assert list(FixHistory(history_file, max_entries=4).load_history_strings()) == expected
+    # the file itself has been truncated to the latest entries
+    assert list(FileHistory(history_file).load_history_strings()) == expected
+    # a stale temp file of an earlier run does not leak into the history
+    FileHistory(history_file + ".tmp").store_string("stale")
+    for num in range(10, 14):
+        file_history.store_string(f"cmd {num}")
+    expected = ["cmd 13", "cmd 12", "cmd 11", "cmd 10"]
+    assert list(FixHistory(history_file, max_entries=4).load_history_strings()) == expected
+    assert list(FileHistory(history_file).load_history_strings()) == expected
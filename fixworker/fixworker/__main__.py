@@ -14,7 +14,7 @@ from multiprocessing.managers import SyncManager
 from fixlib.args import ArgumentParser
 from fixlib.baseplugin import BaseActionPlugin, BaseCollectorPlugin, PluginType
 from fixlib.config import Config
-from fixlib.core import add_args as core_add_args, fixcore, wait_for_fixcore
+from fixlib.core import add_args as core_add_args, fixcore, http_session, wait_for_fixcore
 from fixlib.core.actions import CoreActions, CoreFeedback
 from fixlib.core.ca import TLSData
 from fixlib.core.tasks import CoreTasks, CoreTaskHandler
@@ -102,13 +102,20 @@ def main() -> None:
 
     write_files_to_home_dir(config.fixworker.all_files_in_home_dir(), write_utf8_file)
 
+    # requests to fixcore are sent from different threads, but a session is not guaranteed to be thread safe.
+    # Every thread uses its own session: connections are kept alive and reused by later requests of the same thread.
+    thread_local = threading.local()
+
     def send_request(request: requests.Request) -> requests.Response:
+        session: Optional[requests.Session] = getattr(thread_local, "session", None)
+        if session is None:
+            session = http_session()
+            thread_local.session = session
         prepared = request.prepare()
-        s = requests.Session()
         verify = None
         if tls_data:
             verify = tls_data.verify
-        return s.send(request=prepared, verify=verify)
+        return session.send(request=prepared, verify=verify)
 
     core = FixCore(send_request, config)
 
@@ -118,7 +125,7 @@ def main() -> None:
     mp_manager.start(initializer=fixlib.proc.increase_limits)
     core_messages: Queue[Json] = mp_manager.Queue()
 
-    collector = Collector(config, core, core_messages)
+    collector = Collector(config, core, core_messages, mp_manager)
 
     # Handle Ctrl+c and other means of termination/shutdown
     fixlib.proc.initializer()
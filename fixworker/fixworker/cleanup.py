@@ -28,21 +28,21 @@ def cleanup(
 
     log.info("Running cleanup")
 
-    cg = CoreGraph(tls_data=tls_data)
-
-    search_filter = ""
-    if Config.fixworker.collector and len(Config.fixworker.collector) > 0:
-        clouds = '["' + '", "'.join(Config.fixworker.collector) + '"]'
-        search_filter = f"and /ancestors.cloud.reported.id in {clouds} "
-    search = (
-        f"/desired.clean == true and /metadata.cleaned != true"
-        f" and /metadata.protected!=true {search_filter}<-default,delete[0:]->"
-    )
-
-    graph = cg.graph(search)
-    cleaner = Cleaner(graph, core_feedback)
-    cleaner.cleanup(config, plugins)
-    cg.patch_nodes(graph)
+    with CoreGraph(tls_data=tls_data) as cg:
+        search_filter = ""
+        collector = Config.fixworker.collector
+        if collector and len(collector) > 0:
+            clouds = '["' + '", "'.join(collector) + '"]'
+            search_filter = f"and /ancestors.cloud.reported.id in {clouds} "
+        search = (
+            f"/desired.clean == true and /metadata.cleaned != true"
+            f" and /metadata.protected!=true {search_filter}<-default,delete[0:]->"
+        )
+
+        graph = cg.graph(search)
+        cleaner = Cleaner(graph, core_feedback)
+        cleaner.cleanup(config, plugins)
+        cg.patch_nodes(graph)
 
 
 class Cleaner:
@@ -52,7 +52,11 @@ class Cleaner:
 
     @metrics_cleanup.time()
     def cleanup(self, config: Config, plugins: Dict[str, Type[BaseCollectorPlugin]]) -> None:
-        if not Config.fixworker.cleanup:
+        # the config is looked up dynamically: read it once and not for every node
+        fixworker_config = Config.fixworker
+        dry_run: bool = fixworker_config.cleanup_dry_run
+        pool_size: int = fixworker_config.cleanup_pool_size
+        if not fixworker_config.cleanup:
             log.debug("Cleanup called but fixworker.cleanup not configured" " - ignoring call")
             return
 
@@ -76,11 +80,11 @@ class Cleaner:
 
         log.debug(f"Sending {len(cleanup_nodes)} nodes to pre-cleanup pool")
         with ThreadPoolExecutor(
-            max_workers=Config.fixworker.cleanup_pool_size,
+            max_workers=pool_size,
             thread_name_prefix="pre_cleaner",
         ) as executor:
             executor.map(
-                lambda node: self.pre_clean(config, plugins, node),
+                lambda node: self.pre_clean(config, plugins, node, dry_run),
                 cleanup_nodes,
             )
 
@@ -89,18 +93,20 @@ class Cleaner:
         for nodes in dependent_node_iterator(delete_graph):
             log.debug(f"Cleaning {len(nodes)} nodes in {ordinal(parallel_pass_num)} pass")
             with ThreadPoolExecutor(
-                max_workers=Config.fixworker.cleanup_pool_size,
+                max_workers=pool_size,
                 thread_name_prefix="cleaner",
             ) as executor:
-                executor.map(lambda node: self.clean(config, plugins, node), nodes)
+                executor.map(lambda node: self.clean(config, plugins, node, dry_run), nodes)
             parallel_pass_num += 1
 
-    def pre_clean(self, config: Config, plugins: Dict[str, Type[BaseCollectorPlugin]], node: BaseResource) -> None:
+    def pre_clean(
+        self, config: Config, plugins: Dict[str, Type[BaseCollectorPlugin]], node: BaseResource, dry_run: bool
+    ) -> None:
         if not hasattr(node, "pre_delete") and not hasattr(node, "pre_delete_resource"):
             return
 
         log_prefix = f"Resource {node.rtdname} is marked for removal"
-        if Config.fixworker.cleanup_dry_run:
+        if dry_run:
             log.info(f"{log_prefix}, not calling pre cleanup method because of dry run flag")
             return
 
@@ -116,9 +122,11 @@ class Cleaner:
                 f"An exception occurred when running resource pre cleanup on {node.rtdname}: {ex}", log
             )
 
-    def clean(self, config: Config, plugins: Dict[str, Type[BaseCollectorPlugin]], node: BaseResource) -> None:
+    def clean(
+        self, config: Config, plugins: Dict[str, Type[BaseCollectorPlugin]], node: BaseResource, dry_run: bool
+    ) -> None:
         log_prefix = f"Resource {node.rtdname} is marked for removal"
-        if Config.fixworker.cleanup_dry_run:
+        if dry_run:
             log.info(f"{log_prefix}, not calling cleanup method because of dry run flag")
             return
 
@@ -37,6 +37,7 @@ class CollectRun:
         core_messages: Queue[Json],
         collectors: List[Type[BaseCollectorPlugin]],
         task_data: Json,
+        mp_manager: Optional[SyncManager] = None,
     ) -> None:
         self.config = config
         self.fixcore = fixcore
@@ -45,7 +46,9 @@ class CollectRun:
         self.task_id = task_data["task"]
         self.step_name = task_data["step"]
         self.core_feedback = CoreFeedback(self.task_id, self.step_name, "collect", core_messages)
-        self.mp_manager = SyncManager(ctx=multiprocessing.get_context("spawn"))
+        # a running manager can be shared between runs, which avoids spawning a new manager process per run
+        self.owns_mp_manager = mp_manager is None
+        self.mp_manager = mp_manager or SyncManager(ctx=multiprocessing.get_context("spawn"))
         self.graph_queue: Optional[Queue[Optional[Graph]]] = None
         self.graph_sender_threads: List[threading.Thread] = []
         self.tempdir = mkdtemp(prefix=f"fix-{self.task_id}", dir=config.fixworker.tempdir)
@@ -53,8 +56,9 @@ class CollectRun:
         self.futures_to_wait_for: List[Future[bool]] = []
 
     def __enter__(self) -> CollectRun:
-        log.debug("Create multi process manager")
-        self.mp_manager.start(initializer=fixlib.proc.increase_limits)
+        if self.owns_mp_manager:
+            log.debug("Create multi process manager")
+            self.mp_manager.start(initializer=fixlib.proc.increase_limits)
         graph_queue = self.mp_manager.Queue()
         self.graph_queue = graph_queue
         for i in range(self.config.fixworker.graph_sender_pool_size):
@@ -91,7 +95,8 @@ class CollectRun:
         if self.pool_executor:
             log.debug("Stopping executor")
             self.pool_executor.__exit__(exc_type, exc_val, exc_tb)
-        self.mp_manager.shutdown()
+        if self.owns_mp_manager:
+            self.mp_manager.shutdown()
         if not self.config.fixworker.debug_dump_json:
             rmtree(self.tempdir, ignore_errors=True)
         return None
@@ -121,10 +126,11 @@ class CollectRun:
             import_graph: Future[bool] = Future()
             self.futures_to_wait_for.append(import_graph)
 
-            # Create and sanitize the graph
-            graph = Graph(root=GraphRoot(id="root", tags={}))
-            graph.merge(collector_graph)
+            # Attach the collector graph to a new graph root and sanitize it.
+            # The graph is a private copy received from the queue and can be changed in place.
+            graph = collector_graph
             del collector_graph
+            graph.attach_to_root(GraphRoot(id="root", tags={}))
             sanitize(graph)
 
             # Create a human-readable description of the graph
@@ -181,10 +187,17 @@ class CollectRun:
 
 
 class Collector:
-    def __init__(self, config: Config, fixcore: FixCore, core_messages: Queue[Json]) -> None:
+    def __init__(
+        self,
+        config: Config,
+        fixcore: FixCore,
+        core_messages: Queue[Json],
+        mp_manager: Optional[SyncManager] = None,
+    ) -> None:
         self.fixcore = fixcore
         self.config = config
         self.core_messages = core_messages
+        self.mp_manager = mp_manager
         self.processing: Set[str] = set()
         self.processing_lock = Lock()
 
@@ -201,7 +214,9 @@ class Collector:
                 if processing_id in self.processing:
                     raise DuplicateMessageError(f"Already processing {processing_id} - ignoring message")
                 self.processing.add(processing_id)
-            with CollectRun(self.config, self.fixcore, self.core_messages, collectors, task_data) as run:
+            with CollectRun(
+                self.config, self.fixcore, self.core_messages, collectors, task_data, self.mp_manager
+            ) as run:
                 self.fixcore.create_graph_and_update_model(tempdir=run.tempdir)
                 run.collect()
         finally:
@@ -1,4 +1,4 @@
-import json
+import orjson
 import requests
 import tempfile
 from datetime import datetime
@@ -13,6 +13,9 @@ from tenacity import Retrying
 from tenacity.stop import stop_after_attempt
 from tenacity.wait import wait_fixed
 
+# The graph is sent as chunked request: combine lines into chunks of this size, instead of one chunk per line.
+GraphSendChunkSize = 64 * 1024
+
 
 class FixCore:
     def __init__(
@@ -44,6 +47,7 @@ class FixCore:
             delete_tempfile=not dump_json,
             tempdir=tempdir,
             graph_merge_kind=graph_merge_kind,
+            chunk_size=GraphSendChunkSize,
         )
         #  The graph is not required any longer and can be released.
         del graph
@@ -84,7 +88,7 @@ class FixCore:
 
         log.debug(f"Updating model via {model_uri}")
 
-        model_json = json.dumps(export_model(), indent=4)
+        model_json = orjson.dumps(export_model())
 
         if dump_json:
             ts = datetime.now().strftime("%Y-%m-%d-%H-%M")
@@ -95,7 +99,7 @@ class FixCore:
                 dir=tempdir,
             ) as model_outfile:
                 log.info(f"Writing model json to file {model_outfile.name}")
-                model_outfile.write(model_json.encode())
+                model_outfile.write(model_json)
 
         headers = {"Content-Type": "application/json"}
         if getattr(ArgumentParser.args, "psk", None):
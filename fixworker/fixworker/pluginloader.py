@@ -1,5 +1,5 @@
-import pkg_resources
 import inspect
+from importlib.metadata import entry_points
 from fixlib.logger import log
 from typing import List, Optional, Type, Union, Dict, cast, Set
 from fixlib.args import ArgumentParser
@@ -41,7 +41,7 @@ class PluginLoader:
         BasePlugin.
         """
         log.debug("Finding plugins")
-        for entry_point in pkg_resources.iter_entry_points("fix.plugins"):
+        for entry_point in entry_points(group="fix.plugins"):
             plugin = entry_point.load()
             self.add_plugin(plugin)
         self._initialized = True
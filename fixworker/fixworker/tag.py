@@ -14,12 +14,12 @@ def core_tag_tasks_processor(plugin: BaseCollectorPlugin, config: Config, task_d
     node_data: Dict[str, Any] = task_data.get("node", {})
 
     def delete(node: BaseResource, key: str) -> None:
-        log.debug(f"Calling parent resource to delete tag {key} in cloud")
+        log.debug("Calling parent resource to delete tag %s in cloud", key)
         if plugin.delete_tag(config, node, key):
             log_msg = f"Successfully deleted tag {key} in cloud"
             node.add_change("tags")
             node.log(log_msg)
-            log.info(f"{log_msg} for {node.kind}:{node.id}")
+            log.info("%s for %s:%s", log_msg, node.kind, node.id)
             del node.tags[key]
         else:
             log_msg = f"Error deleting tag {key} in cloud"
@@ -27,12 +27,12 @@ def core_tag_tasks_processor(plugin: BaseCollectorPlugin, config: Config, task_d
             raise AttributeError(f"{log_msg} for {node.kind}:{node.id}")
 
     def update(node: BaseResource, key: str, value: str) -> None:
-        log.debug(f"Calling parent resource to set tag {key} to {value} in cloud")
+        log.debug("Calling parent resource to set tag %s to %s in cloud", key, value)
         if plugin.update_tag(config, node, key, value):
             log_msg = f"Successfully set tag {key} to {value} in cloud"
             node.add_change("tags")
             node.log(log_msg)
-            log.info(f"{log_msg} for {node.kind}:{node.id}")
+            log.info("%s for %s:%s", log_msg, node.kind, node.id)
             node.tags[key] = value
         else:
             log_msg = f"Error setting tag {key} to {value} in cloud {plugin.cloud}"
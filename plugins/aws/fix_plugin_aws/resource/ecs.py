@@ -2086,7 +2086,7 @@ class AwsEcsCluster(EcsTaggable, AwsResource):
             return providers, provider_instances
 
         provider_futures = []
-        for chunk in chunks(list(provider_names), 100):
+        for chunk in chunks(provider_names, 100):
             provider_future = builder.submit_work(service_name, collect_providers, chunk)
             provider_futures.append(provider_future)
         futures_wait(provider_futures)